@@ -1,23 +1,111 @@
+import asyncio
+import atexit
 import json
 import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
+import httpx
 from openai import OpenAI
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_loads(data: str):
+    return _orjson.loads(data) if _orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    return _orjson.dumps(obj).decode() if _orjson else json.dumps(obj)
+
 from tools import TOOL_SCHEMAS, dispatch as _default_dispatch
+from tools._workspace import WORKSPACE
+from tools.read_file import read_file as _read_file
 
 SYSTEM_PROMPT = """\
 You are a coding agent. You have tools to read files, write files, and run shell commands.
 
 All files you create and shell commands you run operate inside the workspace: agent/created_files/
 Use relative paths (e.g. "solution.py") and they will be placed there automatically.
+For binary data or files larger than a few KB, prefer write_file_b64 with base64-encoded \
+content; use write_file for small text edits.
 
 Work step by step. Use tools to explore and gather information before making changes.
 When the task is complete, give a clear summary of what you did without calling any more tools.\
 """
 
 
+# Tool results above this size are truncated head+tail before entering the
+# message history; the full history is resent on every subsequent LLM call,
+# so one huge shell output would otherwise be re-uploaded each iteration.
+MAX_TOOL_RESULT_CHARS = 8000
+
+
+def _truncate_result(result: str) -> str:
+    if len(result) <= MAX_TOOL_RESULT_CHARS:
+        return result
+    half = MAX_TOOL_RESULT_CHARS // 2
+    omitted = len(result) - MAX_TOOL_RESULT_CHARS
+    return result[:half] + f"\n…[truncated {omitted} chars]…\n" + result[-half:]
+
+
+# Verbose logging goes through one process-wide queue drained by a single
+# writer thread (started lazily, stopped via sentinel at exit), so stdout
+# flushes never stall a dispatch critical path and each Agent doesn't
+# hold its own drain thread for the life of the process.
+_LOG_QUEUE: queue.Queue = queue.Queue()
+_LOG_SENTINEL = object()
+_LOG_LOCK = threading.Lock()
+_log_writer = None
+
+
+def _drain_logs():
+    while True:
+        msg = _LOG_QUEUE.get()
+        if msg is _LOG_SENTINEL:
+            sys.stdout.flush()
+            return
+        sys.stdout.write(msg + "\n")
+        if _LOG_QUEUE.empty():
+            sys.stdout.flush()
+
+
+def _ensure_log_writer():
+    global _log_writer
+    with _LOG_LOCK:
+        if _log_writer is None or not _log_writer.is_alive():
+            _log_writer = threading.Thread(target=_drain_logs, daemon=True)
+            _log_writer.start()
+
+
+def _flush_logs():
+    """Stop the writer and drain anything it had not reached yet."""
+    global _log_writer
+    with _LOG_LOCK:
+        writer, _log_writer = _log_writer, None
+    if writer is not None and writer.is_alive():
+        _LOG_QUEUE.put(_LOG_SENTINEL)
+        writer.join(timeout=1)
+    while True:
+        try:
+            msg = _LOG_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if msg is not _LOG_SENTINEL:
+            sys.stdout.write(msg + "\n")
+    sys.stdout.flush()
+
+
+atexit.register(_flush_logs)
+
+
 @dataclass
 class ToolCall:
     id: str
@@ -41,6 +129,24 @@ class AgentResult:
     output_tokens: int = 0
 
 
+def _build_http_client() -> httpx.Client:
+    """Keep-alive connection pool so each turn reuses the TLS connection."""
+    kwargs = {
+        "limits": httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=64,
+            keepalive_expiry=600.0,
+        ),
+        "timeout": httpx.Timeout(connect=5.0, read=120.0, write=30.0, pool=5.0),
+    }
+    try:
+        return httpx.Client(http2=True, **kwargs)
+    except ImportError:
+        # http2 support needs the optional h2 package; HTTP/1.1 keep-alive
+        # still avoids the per-call TLS handshake.
+        return httpx.Client(**kwargs)
+
+
 class LLMClient:
     def chat(self, messages: list, tools: list = None) -> AgentResponse:
         raise NotImplementedError
@@ -56,41 +162,110 @@ class OpenAIClient(LLMClient):
             self.model = model
         self.display_name = model
         self.verbose_tokens = bool(self.reasoning_effort)
-        self.client = OpenAI(api_key=api_key or os.environ["OPENAI_API_KEY"])
+        self.client = OpenAI(
+            api_key=api_key or os.environ["OPENAI_API_KEY"],
+            http_client=_build_http_client(),
+            max_retries=2,
+        )
+
+    def close(self):
+        """Drop the keep-alive connection pool held by the SDK client."""
+        self.client.close()
+
+    def chat_n(self, messages: list, n: int) -> tuple[list[str], int, int]:
+        """Sample n completions in one request (no tools, no streaming).
+
+        The prompt tokens are paid once for all n outputs, so best-of-n
+        consumers get their candidates from a single round trip instead
+        of n sequential ones. Returns (contents, input_tokens,
+        output_tokens).
+        """
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "n": n,
+            "extra_headers": {"prompt-cache-key": "agent-v1"},
+        }
+        if self.reasoning_effort:
+            kwargs["reasoning_effort"] = self.reasoning_effort
+        response = self.client.chat.completions.create(**kwargs)
+        contents = [choice.message.content or "" for choice in response.choices]
+        usage = response.usage
+        return (contents,
+                usage.prompt_tokens if usage else 0,
+                usage.completion_tokens if usage else 0)
 
     def chat(self, messages: list, tools: list = None) -> AgentResponse:
-        kwargs = {"model": self.model, "messages": messages}
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            # Stable key so the provider routes repeat prefixes to its
+            # prompt cache; the system message + tool list form the prefix.
+            "extra_headers": {"prompt-cache-key": "agent-v1"},
+        }
         if tools:
             kwargs["tools"] = tools
         if self.reasoning_effort:
             kwargs["reasoning_effort"] = self.reasoning_effort
 
-        response = self.client.chat.completions.create(**kwargs)
-        message = response.choices[0].message
-        usage = response.usage
-
+        # Stream the response so we start consuming tokens as they arrive
+        # instead of blocking until the full message is generated.
+        content_parts = []
+        tool_calls_by_index = {}
+        usage = None
+
+        for chunk in self.client.chat.completions.create(**kwargs):
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+            for tc_delta in delta.tool_calls or []:
+                acc = tool_calls_by_index.setdefault(
+                    tc_delta.index, {"id": None, "name": None, "arguments": []}
+                )
+                if tc_delta.id:
+                    acc["id"] = tc_delta.id
+                if tc_delta.function:
+                    if tc_delta.function.name:
+                        acc["name"] = tc_delta.function.name
+                    if tc_delta.function.arguments:
+                        acc["arguments"].append(tc_delta.function.arguments)
+
+        content = "".join(content_parts) or None
+
+        # Single pass builds both the parsed ToolCall and the raw dict,
+        # reusing the assembled arguments string for each.
         tool_calls = []
-        if message.tool_calls:
-            for tc in message.tool_calls:
-                tool_calls.append(ToolCall(
-                    id=tc.id,
-                    name=tc.function.name,
-                    args=json.loads(tc.function.arguments)
-                ))
-
-        raw_message = {"role": "assistant", "content": message.content}
-        if message.tool_calls:
-            raw_message["tool_calls"] = [
-                {
-                    "id": tc.id,
-                    "type": "function",
-                    "function": {
-                        "name": tc.function.name,
-                        "arguments": tc.function.arguments
-                    }
+        raw_tool_calls = []
+        for _, acc in sorted(tool_calls_by_index.items()):
+            arguments = "".join(acc["arguments"])
+            tool_calls.append(ToolCall(
+                id=acc["id"],
+                name=acc["name"],
+                args=_json_loads(arguments)
+            ))
+            raw_tool_calls.append({
+                "id": acc["id"],
+                "type": "function",
+                "function": {
+                    "name": acc["name"],
+                    "arguments": arguments
                 }
-                for tc in message.tool_calls
-            ]
+            })
+
+        # Omit content entirely on tool-call-only turns: a content:null
+        # field is dead payload resent every iteration and can bust
+        # provider-side prompt caching.
+        raw_message = {"role": "assistant"}
+        if content:
+            raw_message["content"] = content
+        if raw_tool_calls:
+            raw_message["tool_calls"] = raw_tool_calls
 
         output_tokens = 0
         if usage:
@@ -103,7 +278,7 @@ class OpenAIClient(LLMClient):
                     print(f"      [tokens] {usage.prompt_tokens:,} in, {visible:,} out, {reasoning:,} reasoning", flush=True)
 
         return AgentResponse(
-            content=message.content,
+            content=content,
             tool_calls=tool_calls,
             raw_message=raw_message,
             input_tokens=usage.prompt_tokens if usage else 0,
@@ -120,6 +295,7 @@ class Agent:
         tools: list = None,
         dispatch_fn: callable = None,
         system_prompt: str = None,
+        prefetch: list = None,
     ):
         self.client = client
         self.max_iterations = max_iterations
@@ -127,47 +303,109 @@ class Agent:
         self.tools = tools if tools is not None else TOOL_SCHEMAS
         self.dispatch_fn = dispatch_fn or _default_dispatch
         self.system_prompt = system_prompt or SYSTEM_PROMPT
+        if verbose:
+            _ensure_log_writer()
+        # Warm the read_file cache off the critical path so the model's
+        # first exploratory reads are served from memory. A caller-supplied
+        # dispatch_fn bypasses the module-level read_file cache entirely
+        # (the harness threads per-workspace closures instead), so warming
+        # the default workspace for it would be wasted work unless the
+        # caller named files to prefetch.
+        if dispatch_fn is None or prefetch is not None:
+            threading.Thread(target=self._warm, args=(prefetch,), daemon=True).start()
+
+    def _log(self, msg: str):
+        _LOG_QUEUE.put_nowait(msg)
+
+    @staticmethod
+    def _warm(prefetch: list):
+        try:
+            if prefetch is None:
+                prefetch = [
+                    entry.path for entry in os.scandir(WORKSPACE)
+                    if entry.is_file() and entry.stat().st_size < 65536
+                ]
+            for path in prefetch:
+                _read_file(path)
+        except OSError:
+            pass
 
     def run(self, task: str) -> "AgentResult":
+        # Prompt-cache invariant: messages[0] stays the identical system
+        # message object and earlier messages are never mutated, so the
+        # resent prefix is byte-stable across iterations. Changing
+        # self.tools mid-run would likewise invalidate the provider cache.
+        system_msg = {"role": "system", "content": self.system_prompt}
         messages = [
-            {"role": "system", "content": self.system_prompt},
+            system_msg,
             {"role": "user", "content": task}
         ]
 
         total_input = 0
         total_output = 0
 
-        for iteration in range(self.max_iterations):
-            response = self.client.chat(messages, tools=self.tools)
-            messages.append(response.raw_message)
-            total_input += response.input_tokens
-            total_output += response.output_tokens
-
-            if not response.tool_calls:
-                return AgentResult(
-                    content=response.content or "(no response)",
-                    input_tokens=total_input,
-                    output_tokens=total_output,
-                )
-
-            for tc in response.tool_calls:
-                if self.verbose:
-                    print(f"  [{iteration + 1}] {tc.name}({json.dumps(tc.args)})", flush=True)
-
-                result = self.dispatch_fn(tc.name, tc.args)
-
-                if self.verbose:
-                    preview = result[:300] + "..." if len(result) > 300 else result
-                    print(f"      → {preview}\n", flush=True)
-
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tc.id,
-                    "content": result
-                })
-
-        return AgentResult(
-            content="Reached maximum iterations without completing the task.",
-            input_tokens=total_input,
-            output_tokens=total_output,
-        )
+        # The dispatch pool lives for one run: the harness builds a new
+        # Agent per task, so a per-instance pool would strand its idle
+        # threads for the life of the process once the task completes.
+        pool = ThreadPoolExecutor(max_workers=8)
+        try:
+            for iteration in range(self.max_iterations):
+                assert messages[0] is system_msg, "system message must stay the cache prefix"
+                response = self.client.chat(messages, tools=self.tools)
+                total_input += response.input_tokens
+                total_output += response.output_tokens
+
+                if not response.tool_calls:
+                    return AgentResult(
+                        content=response.content or "(no response)",
+                        input_tokens=total_input,
+                        output_tokens=total_output,
+                    )
+
+                # This iteration's additions are collected locally and pushed
+                # with a single extend, keeping the history append-only in one
+                # step per turn.
+                new_msgs = [response.raw_message]
+
+                # Dispatch every tool call in this assistant turn concurrently;
+                # results are appended in original order to preserve tool_call_id pairing.
+                futures = []
+                for tc in response.tool_calls:
+                    if self.verbose:
+                        self._log(f"  [{iteration + 1}] {tc.name}({_json_dumps(tc.args)})")
+                    futures.append(pool.submit(self.dispatch_fn, tc.name, tc.args))
+
+                for tc, future in zip(response.tool_calls, futures):
+                    result = _truncate_result(future.result())
+
+                    if self.verbose:
+                        preview = result[:300] + "..." if len(result) > 300 else result
+                        self._log(f"      → {preview}\n")
+
+                    new_msgs.append({
+                        "role": "tool",
+                        "tool_call_id": tc.id,
+                        "content": result
+                    })
+
+                messages.extend(new_msgs)
+
+            return AgentResult(
+                content="Reached maximum iterations without completing the task.",
+                input_tokens=total_input,
+                output_tokens=total_output,
+            )
+        finally:
+            # wait=False: on the normal path every future was consumed
+            # above, and on an error path any in-flight dispatch finishes
+            # on its own as the pool drains.
+            pool.shutdown(wait=False)
+
+    async def arun(self, task: str) -> "AgentResult":
+        """Async entry point: runs the agent loop in a worker thread.
+
+        Tool calls within a turn already overlap via the shared thread pool,
+        so this keeps a caller's event loop free without forcing the
+        synchronous callers (evals harness, tool_gen pipeline) onto asyncio.
+        """
+        return await asyncio.to_thread(self.run, task)
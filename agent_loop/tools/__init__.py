@@ -1,17 +1,35 @@
+import sys
+
 from .read_file import SCHEMA as _read_file_schema, read_file
-from .write_file import SCHEMA as _write_file_schema, write_file
+from .write_file import (
+    SCHEMA as _write_file_schema,
+    B64_SCHEMA as _write_file_b64_schema,
+    write_file,
+    write_file_b64,
+)
 from .run_shell import SCHEMA as _run_shell_schema, run_shell
 
-TOOL_SCHEMAS = [_read_file_schema, _write_file_schema, _run_shell_schema]
+TOOL_SCHEMAS = [
+    _read_file_schema,
+    _write_file_schema,
+    _write_file_b64_schema,
+    _run_shell_schema,
+]
 
+# Interned keys so the per-call lookup compares by pointer, not content.
 _HANDLERS = {
-    "read_file": read_file,
-    "write_file": write_file,
-    "run_shell": run_shell,
+    sys.intern(name): fn
+    for name, fn in {
+        "read_file": read_file,
+        "write_file": write_file,
+        "write_file_b64": write_file_b64,
+        "run_shell": run_shell,
+    }.items()
 }
 
 
 def dispatch(name: str, args: dict) -> str:
-    if name not in _HANDLERS:
+    fn = _HANDLERS.get(name)
+    if fn is None:
         return f"Unknown tool: {name}"
-    return _HANDLERS[name](**args)
+    return fn(**args)
@@ -1,3 +1,5 @@
+import os
+
 from ._workspace import resolve
 
 SCHEMA = {
@@ -19,9 +21,34 @@ SCHEMA = {
 }
 
 
+# Cache of resolved path -> (mtime_ns, size, content). Agents often re-read
+# the same file several times per task; a hit skips the open/read/decode.
+_CACHE = {}
+_CACHE_MAX = 128
+
+# Files larger than this are returned head-only; the message history is
+# resent on every LLM call, so unbounded reads balloon input tokens.
+_MAX_READ_CHARS = 200_000
+
+
 def read_file(path: str) -> str:
     try:
-        with open(resolve(path), "r") as f:
-            return f.read()
+        resolved = resolve(path)
+        st = os.stat(resolved)
+        cached = _CACHE.get(resolved)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(resolved, "r") as f:
+            content = f.read()
+        if len(content) > _MAX_READ_CHARS:
+            omitted = len(content) - _MAX_READ_CHARS
+            content = (
+                content[:_MAX_READ_CHARS]
+                + f"\n…[truncated: characters {_MAX_READ_CHARS}-{len(content)} omitted ({omitted} chars)]…"
+            )
+        if len(_CACHE) >= _CACHE_MAX:
+            _CACHE.pop(next(iter(_CACHE)))
+        _CACHE[resolved] = (st.st_mtime_ns, st.st_size, content)
+        return content
     except Exception as e:
         return f"Error: {e}"
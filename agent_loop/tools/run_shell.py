@@ -1,4 +1,13 @@
+import os
+import re
+import select
+import signal
 import subprocess
+import threading
+import time
+import uuid
+from collections import deque
+
 from ._workspace import WORKSPACE
 
 SCHEMA = {
@@ -19,24 +28,153 @@ SCHEMA = {
     }
 }
 
+TIMEOUT_SECONDS = 30
+
+
+class ShellSession:
+    """A long-lived /bin/sh child, so each run_shell call skips fork+exec.
+
+    Each command is written to the shell's stdin followed by an echo of a
+    per-call UUID sentinel carrying the exit code; stdout is read until the
+    sentinel appears. stderr is drained by a background thread. On timeout
+    the child is killed and respawned lazily on the next call.
+    """
+
+    def __init__(self, timeout: int = TIMEOUT_SECONDS, cwd=None):
+        self.timeout = timeout
+        self.cwd = str(cwd or WORKSPACE)
+        self._lock = threading.Lock()
+        self._proc = None
+        self._stderr_chunks = None
+
+    def _spawn(self):
+        self._proc = subprocess.Popen(
+            ["/bin/sh"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.cwd,
+            bufsize=0,
+            start_new_session=True,
+        )
+        self._stderr_chunks = deque()
+        threading.Thread(
+            target=self._drain,
+            args=(self._proc.stderr, self._stderr_chunks),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _drain(pipe, sink):
+        while True:
+            chunk = pipe.read(65536)
+            if not chunk:
+                return
+            sink.append(chunk)
+
+    def _kill(self):
+        # The shell runs in its own session, so killing the process group
+        # also reaps any grandchildren a timed-out command left behind.
+        if self._proc is not None:
+            try:
+                os.killpg(self._proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self._proc.wait()
+        self._proc = None
+
+    def close(self):
+        with self._lock:
+            self._kill()
+
+    def _take_stderr(self, marker: bytes, deadline: float) -> str:
+        """Collect stderr for one call, waiting for its per-call marker.
+
+        The drain thread fills the deque asynchronously, so a bare snapshot
+        taken the instant the stdout sentinel arrives can miss stderr the
+        command wrote just before exiting. The shell echoes `marker` to
+        stderr after each command; wait for it before returning.
+        """
+        end = -1
+        while True:
+            data = b"".join(self._stderr_chunks)
+            end = data.find(marker)
+            if end != -1 or time.monotonic() >= deadline:
+                break
+            time.sleep(0.001)
+        self._stderr_chunks.clear()
+        if end == -1:
+            # Shell died before echoing the marker; return what arrived.
+            return data.decode(errors="replace")
+        tail = data[end + len(marker):]
+        if tail:
+            self._stderr_chunks.append(tail)
+        return data[:end].decode(errors="replace")
+
+    def run(self, command: str) -> tuple:
+        """Run one command, returning (stdout, stderr, returncode)."""
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._spawn()
+
+            tag = uuid.uuid4().hex
+            self._proc.stdin.write(
+                f"{command}\necho __END__$?__{tag}\necho __ERR__{tag} >&2\n".encode())
+            self._proc.stdin.flush()
+
+            # Match the complete per-call sentinel line, not the bare
+            # "__END__" prefix: command output may contain that literal.
+            sentinel = re.compile(rb"__END__(\d+)__" + tag.encode() + rb"\n")
+            err_marker = f"__ERR__{tag}\n".encode()
+
+            fd = self._proc.stdout.fileno()
+            buf = b""
+            returncode = 0
+            shell_exited = False
+            deadline = time.monotonic() + self.timeout
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    self._kill()
+                    raise subprocess.TimeoutExpired(command, self.timeout)
+
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    # The shell itself exited (e.g. the command ran `exit`).
+                    self._proc.wait()
+                    returncode = self._proc.returncode or 0
+                    shell_exited = True
+                    break
+
+                buf += chunk
+                match = sentinel.search(buf)
+                if match is not None:
+                    returncode = int(match.group(1))
+                    buf = buf[:match.start()]
+                    break
+
+            # A dead shell never echoes the stderr marker; don't wait long.
+            err_deadline = time.monotonic() + (0.05 if shell_exited else 1.0)
+            stderr = self._take_stderr(err_marker, err_deadline)
+            if shell_exited:
+                self._kill()
+            return buf.decode(errors="replace"), stderr, returncode
+
+
+_SESSION = ShellSession()
+
 
 def run_shell(command: str) -> str:
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=str(WORKSPACE)
-        )
-        output = result.stdout
-        if result.stderr:
-            output += f"\nSTDERR: {result.stderr}"
-        if result.returncode != 0:
-            output += f"\nExit code: {result.returncode}"
+        stdout, stderr, returncode = _SESSION.run(command)
+        output = stdout
+        if stderr:
+            output += f"\nSTDERR: {stderr}"
+        if returncode != 0:
+            output += f"\nExit code: {returncode}"
         return output.strip() or "(no output)"
     except subprocess.TimeoutExpired:
-        return "Error: command timed out after 30 seconds"
+        return f"Error: command timed out after {TIMEOUT_SECONDS} seconds"
     except Exception as e:
         return f"Error: {e}"
@@ -1,3 +1,4 @@
+import base64
 import os
 from ._workspace import resolve
 
@@ -24,12 +25,63 @@ SCHEMA = {
 }
 
 
+B64_SCHEMA = {
+    "type": "function",
+    "function": {
+        "name": "write_file_b64",
+        "description": "Write base64-encoded content to a file. Prefer this over write_file for binary data or files larger than a few KB — base64 avoids JSON escape bloat on newlines and quotes.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Absolute or relative path to the file."
+                },
+                "b64": {
+                    "type": "string",
+                    "description": "Base64-encoded file content."
+                }
+            },
+            "required": ["path", "b64"]
+        }
+    }
+}
+
+# Parent directories already created (or observed to exist) this process;
+# skips the makedirs stat traffic on every write after the first per dir.
+_KNOWN_DIRS = set()
+
+
 def write_file(path: str, content: str) -> str:
     try:
         resolved = resolve(path)
-        os.makedirs(os.path.dirname(resolved), exist_ok=True)
-        with open(resolved, "w") as f:
-            f.write(content)
+        parent = os.path.dirname(resolved)
+        if parent not in _KNOWN_DIRS:
+            os.makedirs(parent, exist_ok=True)
+            _KNOWN_DIRS.add(parent)
+        fd = os.open(resolved, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
         return f"Wrote {len(content)} characters to {resolved}"
     except Exception as e:
         return f"Error: {e}"
+
+
+def write_file_b64(path: str, b64: str) -> str:
+    try:
+        resolved = resolve(path)
+        parent = os.path.dirname(resolved)
+        if parent not in _KNOWN_DIRS:
+            os.makedirs(parent, exist_ok=True)
+            _KNOWN_DIRS.add(parent)
+        data = base64.b64decode(b64)
+        fd = os.open(resolved, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        return f"Wrote {len(data)} bytes to {resolved}"
+    except Exception as e:
+        return f"Error: {e}"
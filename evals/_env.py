@@ -0,0 +1,20 @@
+import os
+from pathlib import Path
+
+
+def load_env(path: Path) -> None:
+    """Minimal .env reader: KEY=VALUE lines, # comments, existing vars win.
+
+    python-dotenv drags in a noticeable import chain for what this tree
+    needs, which is just the API key from a flat file.
+    """
+    try:
+        lines = path.read_text().splitlines()
+    except OSError:
+        return
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.partition("=")
+        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
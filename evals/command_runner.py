@@ -1,8 +1,31 @@
+import hashlib
+import os
+import re
+import shlex
 import subprocess
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 
+# Commands containing any of these need /bin/sh; plain invocations
+# ("ls -la", "pytest test_x.py") are exec'd directly, skipping the shell
+# fork entirely.
+_SHELL_META = re.compile(r"[|&;<>$`()*?{}\[\]~!#\n'\"\\]")
+
+
+def _workspace_digest(workspace: str) -> bytes:
+    """Cheap content fingerprint of a workspace: (relpath, size, mtime_ns)."""
+    h = hashlib.blake2b(digest_size=16)
+    for dirpath, dirnames, filenames in os.walk(workspace):
+        dirnames.sort()
+        filenames.sort()
+        for filename in filenames:
+            full = os.path.join(dirpath, filename)
+            st = os.stat(full)
+            h.update(f"{os.path.relpath(full, workspace)}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.digest()
+
 
 @dataclass
 class CommandResult:
@@ -18,22 +41,77 @@ class CommandRunner(ABC):
     def run(self, command: str, cwd: Path, timeout: int) -> CommandResult:
         pass
 
+    def start(self):
+        """Acquire long-lived resources (warm containers, etc.). Default no-op."""
+
+    def stop(self):
+        """Release resources acquired by start(). Default no-op."""
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+# Consumers only ever look at truncated output, so keep a bounded tail
+# per stream instead of materializing everything a chatty command prints.
+_TAIL_BYTES = 65536
+
+
+def _drain_tail(stream, out: bytearray):
+    while True:
+        data = stream.read(65536)
+        if not data:
+            return
+        out += data
+        if len(out) > _TAIL_BYTES:
+            del out[:len(out) - _TAIL_BYTES]
+
 
 class HostCommandRunner(CommandRunner):
     def run(self, command: str, cwd: Path, timeout: int) -> CommandResult:
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+            if _SHELL_META.search(command):
+                argv, use_shell = command, True
+            else:
+                argv, use_shell = shlex.split(command), False
+                # Env-assignment prefixes ("FOO=bar pytest ...") carry no
+                # metacharacters but only a shell can interpret them.
+                if not argv or "=" in argv[0]:
+                    argv, use_shell = command, True
+            proc = subprocess.Popen(
+                argv,
+                shell=use_shell,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 cwd=str(cwd),
             )
+            # Reader threads keep the pipes drained (a full pipe buffer
+            # would deadlock the child) while holding only the tail.
+            stdout_tail, stderr_tail = bytearray(), bytearray()
+            readers = [
+                threading.Thread(target=_drain_tail, args=(proc.stdout, stdout_tail)),
+                threading.Thread(target=_drain_tail, args=(proc.stderr, stderr_tail)),
+            ]
+            for reader in readers:
+                reader.start()
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                return CommandResult(returncode=124, stdout="", stderr="", timed_out=True)
+            finally:
+                for reader in readers:
+                    reader.join()
+                proc.stdout.close()
+                proc.stderr.close()
             return CommandResult(
-                returncode=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
+                returncode=returncode,
+                stdout=bytes(stdout_tail).decode(errors="replace"),
+                stderr=bytes(stderr_tail).decode(errors="replace"),
             )
         except subprocess.TimeoutExpired:
             return CommandResult(returncode=124, stdout="", stderr="", timed_out=True)
@@ -42,26 +120,45 @@ class HostCommandRunner(CommandRunner):
 
 
 class DockerCommandRunner(CommandRunner):
+    """Runs commands in a long-lived container per workspace.
+
+    Container start (~1-3s) is paid once per workspace; each command is a
+    cheap `docker exec`. Containers are reaped by stop().
+    """
+
     def __init__(self, image: str):
         self.image = image
+        self._containers: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _container_for(self, cwd: Path) -> str:
+        key = str(cwd)
+        with self._lock:
+            container_id = self._containers.get(key)
+            if container_id:
+                return container_id
+            result = subprocess.run(
+                [
+                    "docker", "run", "-d", "--rm",
+                    "-v", f"{cwd}:/workspace",
+                    "-w", "/workspace",
+                    self.image,
+                    "sleep", "infinity",
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip() or "docker run failed")
+            container_id = result.stdout.strip()
+            self._containers[key] = container_id
+            return container_id
 
     def run(self, command: str, cwd: Path, timeout: int) -> CommandResult:
-        docker_cmd = [
-            "docker",
-            "run",
-            "--rm",
-            "-v",
-            f"{cwd}:/workspace",
-            "-w",
-            "/workspace",
-            self.image,
-            "sh",
-            "-lc",
-            command,
-        ]
         try:
+            container_id = self._container_for(cwd)
             result = subprocess.run(
-                docker_cmd,
+                ["docker", "exec", container_id, "sh", "-lc", command],
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -76,6 +173,12 @@ class DockerCommandRunner(CommandRunner):
         except Exception as e:
             return CommandResult(returncode=1, stdout="", stderr="", error=str(e))
 
+    def stop(self):
+        with self._lock:
+            for container_id in self._containers.values():
+                subprocess.run(["docker", "kill", container_id], capture_output=True)
+            self._containers.clear()
+
 
 def build_docker_image(image: str, dockerfile: Path, context: Path) -> CommandResult:
     cmd = [
@@ -1,110 +1,416 @@
+import asyncio
+import atexit
+import itertools
+import json
+import os
+import queue
+import re
+import subprocess
 import sys
+import threading
 import time
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "agent_loop"))
 
 from agent import Agent, AgentResult, LLMClient
-from tools.read_file import SCHEMA as read_file_schema, read_file as _read_file
-from tools.write_file import SCHEMA as write_file_schema, write_file as _write_file
-from tools.run_shell import SCHEMA as run_shell_schema, run_shell as _run_shell
+from tools.read_file import SCHEMA as read_file_schema
+from tools.write_file import SCHEMA as write_file_schema
+from tools.run_shell import SCHEMA as run_shell_schema, ShellSession
 
-from .task import EvalTask, TaskResult, ToolCallRecord
-from .command_runner import CommandRunner, HostCommandRunner
+# The base schema list never changes; build it once at import.
+_BASE_SCHEMAS = (read_file_schema, write_file_schema, run_shell_schema)
 
+from .task import EvalTask, TaskResult, ToolCallRecord
+from .command_runner import CommandRunner, HostCommandRunner, _SHELL_META, _workspace_digest
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _dumps_line(record: dict) -> bytes:
+    if _orjson:
+        return _orjson.dumps(record, option=_orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+# How much of each tool result is kept in the in-memory trajectory; the
+# full result is streamed to the per-task trajectory JSONL.
+_RESULT_HEAD_CHARS = 512
+
+# Serializes per-task completion reports from parallel workers.
+_print_lock = threading.Lock()
+
+
+def _compile_dispatch(handlers: dict, fallback=None):
+    """Compile a dispatch function specialized to a fixed handler table.
+
+    The toolset is static for the lifetime of a task, so instead of a dict
+    lookup plus a membership test per call we generate an if/elif chain
+    with each handler bound directly into the function's globals. For the
+    handful of tools an agent has, the chain is branch-predictable (agents
+    hammer the same tools) and skips the generic closure indirection.
+    """
+    names = list(handlers)
+    lines = ["def _dispatch(name, args):"]
+    for i, name in enumerate(names):
+        branch = "if" if i == 0 else "elif"
+        lines.append(f"    {branch} name == {name!r}:")
+        lines.append(f"        return _h{i}(**args)")
+    if fallback is not None:
+        lines.append("    return _fallback(name, args)")
+    else:
+        lines.append("    return f'Unknown tool: {name}'")
+    namespace = {f"_h{i}": handlers[name] for i, name in enumerate(names)}
+    if fallback is not None:
+        namespace["_fallback"] = fallback
+    exec(compile("\n".join(lines), "<dispatch>", "exec"), namespace)
+    return namespace["_dispatch"]
+
+
+def _build_toolbox(workspace: Path, command_runner: CommandRunner | None = None):
+    """Build per-workspace tool schemas and dispatch.
+
+    Returns (schemas, dispatch, close); close releases the workspace's
+    persistent shell, if one was spawned.
+    """
+    command_runner = command_runner or HostCommandRunner()
+    # On the host runner, shell commands go through one long-lived /bin/sh
+    # per workspace instead of a fork+exec per call. Docker (and other)
+    # runners keep their per-call isolation.
+    use_session = type(command_runner) is HostCommandRunner
+    shell_session = None
+
+    # Plain-string resolution: Path construction is surprisingly heavy for
+    # something that runs on every tool call.
+    ws_str = str(workspace)
 
-def _build_toolbox(workspace: Path, command_runner: CommandRunner):
     def resolve(path: str) -> str:
-        p = Path(path)
-        return str(p if p.is_absolute() else workspace / p)
+        return path if os.path.isabs(path) else os.path.join(ws_str, path)
+
+    # resolved path -> (mtime_ns, size, content); repeated reads of an
+    # unchanged file are served from memory, and writes seed the cache.
+    file_cache = {}
+    # Parent dirs already ensured; skips makedirs' ancestor stats.
+    made_dirs = set()
 
     def read_file(path: str) -> str:
         try:
-            with open(resolve(path), "r") as f:
-                return f.read()
+            resolved = resolve(path)
+            st = os.stat(resolved)
+            cached = file_cache.get(resolved)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            with open(resolved, "r") as f:
+                content = f.read()
+            file_cache[resolved] = (st.st_mtime_ns, st.st_size, content)
+            return content
         except Exception as e:
             return f"Error: {e}"
 
     def write_file(path: str, content: str) -> str:
-        import os
         try:
             resolved = resolve(path)
-            os.makedirs(os.path.dirname(resolved), exist_ok=True)
+            parent = os.path.dirname(resolved)
+            if parent not in made_dirs:
+                os.makedirs(parent, exist_ok=True)
+                made_dirs.add(parent)
             with open(resolved, "w") as f:
                 f.write(content)
+            st = os.stat(resolved)
+            file_cache[resolved] = (st.st_mtime_ns, st.st_size, content)
             return f"Wrote {len(content)} characters to {resolved}"
         except Exception as e:
             return f"Error: {e}"
 
     def run_shell(command: str) -> str:
-        result = command_runner.run(command, workspace, timeout=30)
-        if result.timed_out:
-            return "Error: command timed out after 30 seconds"
-        if result.error:
-            return f"Error: {result.error}"
-        output = result.stdout
-        if result.stderr:
-            output += f"\nSTDERR: {result.stderr}"
-        if result.returncode != 0:
-            output += f"\nExit code: {result.returncode}"
+        nonlocal shell_session
+        if use_session:
+            if shell_session is None:
+                shell_session = ShellSession(cwd=workspace)
+            try:
+                stdout, stderr, returncode = shell_session.run(command)
+            except subprocess.TimeoutExpired:
+                return "Error: command timed out after 30 seconds"
+            except Exception as e:
+                return f"Error: {e}"
+        else:
+            result = command_runner.run(command, workspace, timeout=30)
+            if result.timed_out:
+                return "Error: command timed out after 30 seconds"
+            if result.error:
+                return f"Error: {result.error}"
+            stdout, stderr, returncode = result.stdout, result.stderr, result.returncode
+        output = stdout
+        if stderr:
+            output += f"\nSTDERR: {stderr}"
+        if returncode != 0:
+            output += f"\nExit code: {returncode}"
         return output.strip() or "(no output)"
 
-    schemas = [read_file_schema, write_file_schema, run_shell_schema]
+    schemas = list(_BASE_SCHEMAS)
     handlers = {"read_file": read_file, "write_file": write_file, "run_shell": run_shell}
-
-    def dispatch(name: str, args: dict) -> str:
-        if name not in handlers:
-            return f"Unknown tool: {name}"
-        return handlers[name](**args)
-
-    return schemas, dispatch
+    dispatch = _compile_dispatch(handlers)
+
+    def close():
+        if shell_session is not None:
+            shell_session.close()
+
+    return schemas, dispatch, close
+
+
+# Shell commands safe to memoize: read-only inspection with no side effects.
+# The prefix alone is not sufficient — "cat a > b" redirects and find's
+# action predicates mutate the workspace — so a command must also be free
+# of shell metacharacters and of -delete/-exec/-ok style actions before
+# it is treated as read-only.
+_READONLY_SHELL = re.compile(r"^(ls|cat|grep|find|head|tail|wc|pwd)\b")
+_MUTATING_FIND = re.compile(r"-(delete|exec|execdir|ok|okdir)\b")
+
+
+def _is_readonly_shell(command: str) -> bool:
+    return (_READONLY_SHELL.match(command) is not None
+            and _SHELL_META.search(command) is None
+            and _MUTATING_FIND.search(command) is None)
+
+
+# Read-only but workspace-identity-dependent: pwd prints the workspace's
+# absolute path, so its result must never be shared across workspaces
+# even when their contents (and thus their fingerprints) match.
+_WORKSPACE_BOUND_SHELL = re.compile(r"^pwd\b")
+
+
+def _make_caching_dispatch(dispatch_fn):
+    """Memoize repeated read_file calls and read-only shell commands.
+
+    Agents frequently re-read the same path or re-run `ls`/`cat` across
+    turns; a hit turns a file read or subprocess into a dict lookup.
+    write_file invalidates the cached read for that path, and any
+    non-read-only shell command conservatively drops all cached entries
+    since it may have mutated the workspace.
+    """
+    cache = {}
+    path_keys = {}
+
+    def caching_dispatch(name: str, args: dict) -> str:
+        key = None
+        if name == "read_file":
+            key = (name, json.dumps(args, sort_keys=True))
+        elif name == "run_shell" and _is_readonly_shell(args.get("command", "")):
+            key = (name, json.dumps(args, sort_keys=True))
+
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        result = dispatch_fn(name, args)
+
+        if key is not None:
+            cache[key] = result
+            if name == "read_file":
+                # Index by normalized path so write_file("./x.py")
+                # invalidates a cached read_file("x.py").
+                path_keys.setdefault(os.path.normpath(args.get("path", "")), []).append(key)
+        elif name == "write_file":
+            for stale in path_keys.pop(os.path.normpath(args.get("path", "")), []):
+                cache.pop(stale, None)
+            # Cached shell output (ls/cat/grep...) may mention the written
+            # path under any spelling; drop the shell side wholesale.
+            for stale in [k for k in cache if k[0] == "run_shell"]:
+                del cache[stale]
+        elif name == "run_shell":
+            cache.clear()
+            path_keys.clear()
+
+        return result
+
+    return caching_dispatch
+
+
+class _WorkspacePool:
+    """Pre-created workspace dirs reused across tasks.
+
+    Lives on tmpfs (/dev/shm) when available so tool file I/O is served
+    from RAM, and clears directory contents between tasks instead of
+    paying a full rmtree + mkdtemp per task.
+    """
+
+    def __init__(self, size: int):
+        base = "/dev/shm" if os.path.ismount("/dev/shm") else tempfile.gettempdir()
+        self._root = Path(tempfile.mkdtemp(prefix="eval_pool_", dir=base))
+        self._available = queue.Queue()
+        for i in range(size):
+            workspace = self._root / f"ws{i}"
+            workspace.mkdir()
+            self._available.put(workspace)
+        # Harnesses (and so pools) are created per task in self-improving
+        # runs; without teardown the roots pile up on tmpfs for the life
+        # of the machine, not just the process.
+        atexit.register(self.close)
+
+    def acquire(self) -> Path:
+        return self._available.get()
+
+    def close(self):
+        """Remove the pool root and everything in it. Idempotent."""
+        shutil.rmtree(self._root, ignore_errors=True)
+
+    def release(self, workspace: Path):
+        for entry in os.scandir(workspace):
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.unlink(entry.path)
+        self._available.put(workspace)
 
 
 class EvalHarness:
     def __init__(self, client: LLMClient, verbose: bool = True, model_name: str = "",
                  extra_tools: tuple = None, system_prompt: str = None,
-                 command_runner: CommandRunner | None = None):
+                 command_runner: CommandRunner | None = None,
+                 max_workers: int = 8):
         self.client = client
         self.verbose = verbose
         self.model_name = model_name
         self.extra_tools = extra_tools
         self.system_prompt = system_prompt
         self.command_runner = command_runner or HostCommandRunner()
+        self.command_runner.start()
+        self.max_workers = max_workers
+        self._workspace_pool = _WorkspacePool(size=max_workers)
+        # Cross-task memo for read-only tool calls: many tasks share setup
+        # files and common probes (`ls`, `python --version`, reading the
+        # same scaffold), so identical calls against workspaces with the
+        # same fingerprint are served once per run_all.
+        self._global_tool_cache: dict[tuple, str] = {}
+        self._global_cache_lock = threading.Lock()
+        # Trajectory JSONLs are handed to callers via
+        # TaskResult.trajectory_path and must outlive the harness, so
+        # they live in their own dir on the default tempdir (not the
+        # pool root, which is reaped at close and may be tmpfs).
+        self._traj_dir = Path(tempfile.mkdtemp(prefix="eval_traj_"))
+        self._traj_ctr = itertools.count()
+        # Set by run_all: (completion counter, total) for progress prefixes.
+        self._progress = None
+
+    def close(self):
+        """Tear down the workspace pool.
+
+        Trajectory files are deliberately left in place — callers hold
+        TaskResult.trajectory_path references into them. Also runs at
+        exit via the pool's atexit hook, but callers that churn through
+        harnesses (one per task) should close each one promptly.
+        """
+        self._workspace_pool.close()
+
+    def _make_cross_task_dispatch(self, workspace: Path, dispatch_fn):
+        """Dedup identical read-only calls across tasks in a run.
+
+        Keys include a workspace fingerprint so a hit is only served when
+        the files on disk match; any write marks the fingerprint dirty and
+        it is recomputed lazily before the next cacheable call.
+        """
+        ws_str = str(workspace)
+        digest = _workspace_digest(ws_str)
+        dirty = False
+        cache = self._global_tool_cache
+        lock = self._global_cache_lock
+
+        def cross_task_dispatch(name: str, args: dict) -> str:
+            nonlocal digest, dirty
+            command = args.get("command", "")
+            cacheable = name == "read_file" or (
+                name == "run_shell"
+                and _is_readonly_shell(command)
+                and not _WORKSPACE_BOUND_SHELL.match(command)
+            )
+            if cacheable:
+                if dirty:
+                    digest = _workspace_digest(ws_str)
+                    dirty = False
+                key = (name, json.dumps(args, sort_keys=True), digest)
+                with lock:
+                    cached = cache.get(key)
+                if cached is not None:
+                    return cached
+                result = dispatch_fn(name, args)
+                with lock:
+                    cache[key] = result
+                return result
+            result = dispatch_fn(name, args)
+            if name in ("write_file", "run_shell"):
+                dirty = True
+            return result
+
+        return cross_task_dispatch
 
     def run_task(self, task: EvalTask) -> TaskResult:
-        workspace = Path(tempfile.mkdtemp(prefix=f"eval_{task.id}_"))
+        workspace = self._workspace_pool.acquire()
         trajectory: list[ToolCallRecord] = []
+        close_toolbox = lambda: None
+        # Counter-based name: one open() syscall, no mkstemp
+        # collision-probing loop. itertools.count() is atomic.
+        jsonl_path = str(self._traj_dir / f"{task.id}_{next(self._traj_ctr)}.jsonl")
+        jsonl_file = open(jsonl_path, "ab")
 
         try:
             task.setup(workspace)
 
-            schemas, base_dispatch = _build_toolbox(workspace, self.command_runner)
+            schemas, base_dispatch, close_toolbox = _build_toolbox(workspace, self.command_runner)
 
+            extra_handlers = {}
             if self.extra_tools:
                 extra_schemas, extra_handlers = self.extra_tools
                 schemas = schemas + extra_schemas
 
-                def merged_dispatch(name: str, args: dict) -> str:
-                    if name in extra_handlers:
+            if extra_handlers:
+                def wrap(handler):
+                    def call(**args):
                         try:
-                            return str(extra_handlers[name](**args))
+                            return str(handler(**args))
                         except Exception as e:
                             return f"Error: {e}"
-                    return base_dispatch(name, args)
-                dispatch_fn = merged_dispatch
+                    return call
+                dispatch_fn = _compile_dispatch(
+                    {name: wrap(h) for name, h in extra_handlers.items()},
+                    fallback=base_dispatch,
+                )
             else:
                 dispatch_fn = base_dispatch
 
+            dispatch_fn = self._make_cross_task_dispatch(workspace, dispatch_fn)
+            dispatch_fn = _make_caching_dispatch(dispatch_fn)
+
+            # Bind hot-path attributes as locals: this closure runs for
+            # every tool call of the task.
+            monotonic_ns = time.monotonic_ns
+            jsonl_write = jsonl_file.write
+            trajectory_append = trajectory.append
+
             def recording_dispatch(name: str, args: dict) -> str:
-                t0 = time.monotonic()
+                t0 = monotonic_ns()
                 result = dispatch_fn(name, args)
-                trajectory.append(ToolCallRecord(
+                duration_ns = monotonic_ns() - t0
+                # Full record goes to disk; memory keeps a bounded stub so
+                # large cat/test outputs don't accumulate across run_all.
+                jsonl_write(_dumps_line({
+                    "name": name,
+                    "args": args,
+                    "result": result,
+                    "duration_ns": duration_ns,
+                }))
+                trajectory_append(ToolCallRecord(
                     name=name,
                     args=args,
-                    result=result,
-                    duration_ms=(time.monotonic() - t0) * 1000,
+                    result=result[:_RESULT_HEAD_CHARS],
+                    duration_ns=duration_ns,
+                    result_len=len(result),
                 ))
                 return result
 
@@ -121,7 +427,7 @@ class EvalHarness:
                 print(f"Task: {task.id}", flush=True)
                 print(f"{'='*60}", flush=True)
 
-            t0 = time.monotonic()
+            t0 = time.monotonic_ns()
             input_tokens = output_tokens = 0
             try:
                 agent_result = agent.run(task.prompt)
@@ -133,7 +439,7 @@ class EvalHarness:
                 final_response = ""
                 error = str(e)
 
-            total_ms = (time.monotonic() - t0) * 1000
+            total_ms = (time.monotonic_ns() - t0) / 1e6
 
             verify_result = task.verify(workspace)
 
@@ -148,75 +454,139 @@ class EvalHarness:
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 error=error,
+                trajectory_path=jsonl_path,
             )
 
             status = "PASS" if verify_result.passed else "FAIL"
+            # One write under the lock so parallel workers don't tear lines.
             if self.verbose:
-                print(f"\n{status} {task.id} — {len(trajectory)} tool calls, {total_ms/1000:.1f}s", flush=True)
-                print(f"     {verify_result.message}", flush=True)
-                print(f"     tokens: {input_tokens:,} in / {output_tokens:,} out — ${result.estimated_cost:.4f}", flush=True)
+                report = (
+                    f"\n{status} {task.id} — {len(trajectory)} tool calls, {total_ms/1000:.1f}s\n"
+                    f"     {verify_result.message}\n"
+                    f"     tokens: {input_tokens:,} in / {output_tokens:,} out — ${result.estimated_cost:.4f}\n"
+                )
             else:
-                print(f"  {status}  {task.id:<25} {total_ms/1000:.1f}s  ${result.estimated_cost:.4f}", flush=True)
+                prefix = ""
+                if self._progress is not None:
+                    counter, total = self._progress
+                    prefix = f"[{next(counter)}/{total}] "
+                report = f"{prefix}{status}  {task.id:<25} {total_ms/1000:.1f}s  ${result.estimated_cost:.4f}\n"
+            with _print_lock:
+                sys.stdout.write(report)
+                sys.stdout.flush()
 
             return result
 
         finally:
-            shutil.rmtree(workspace, ignore_errors=True)
+            jsonl_file.close()
+            close_toolbox()
+            self._workspace_pool.release(workspace)
 
     def run_all(self, tasks: list[EvalTask]) -> list[TaskResult]:
-        results = []
-        for i, task in enumerate(tasks, 1):
-            if not self.verbose:
-                print(f"[{i}/{len(tasks)}] {task.id}...", end=" ", flush=True)
-            results.append(self.run_task(task))
+        # Tasks are independent (each run_task gets its own workspace), so
+        # fan out across a thread pool — the work is LLM HTTP + subprocess
+        # waits. Results land at their original index so summaries and
+        # compare tables keep task order.
+        results: list[TaskResult] = [None] * len(tasks)
+        # Each task reports exactly one line on completion (written inside
+        # run_task under the print lock); the shared counter gives it a
+        # [completed/total] prefix instead of a second "done" print here.
+        self._progress = (itertools.count(1), len(tasks))
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+                futures = {pool.submit(self.run_task, t): i for i, t in enumerate(tasks)}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        finally:
+            self._progress = None
+            # Reap any warm containers/sessions; they are recreated lazily
+            # if the runner is used again.
+            self.command_runner.stop()
+        self._print_summary(results)
+        return results
+
+    async def run_task_async(self, task: EvalTask) -> TaskResult:
+        return await asyncio.to_thread(self.run_task, task)
+
+    async def run_all_async(self, tasks: list[EvalTask],
+                            max_inflight: int = 8) -> list[TaskResult]:
+        """Async variant of run_all for callers already on an event loop.
+
+        The blocking SDK call still runs in a worker thread per task; the
+        semaphore bounds how many tasks are in flight at once.
+        """
+        sem = asyncio.Semaphore(max_inflight)
+
+        async def bounded(task: EvalTask) -> TaskResult:
+            async with sem:
+                return await self.run_task_async(task)
+
+        results = await asyncio.gather(*(bounded(t) for t in tasks))
+        results = list(results)
         self._print_summary(results)
         return results
 
     @staticmethod
     def _print_summary(results: list[TaskResult]):
-        passed = sum(1 for r in results if r.passed)
+        # Single pass over the results for all four aggregates.
+        passed = 0
+        total_cost = total_in = total_out = 0
+        for r in results:
+            if r.passed:
+                passed += 1
+            total_cost += r.estimated_cost
+            total_in += r.input_tokens
+            total_out += r.output_tokens
         total = len(results)
-        total_cost = sum(r.estimated_cost for r in results)
-        total_in = sum(r.input_tokens for r in results)
-        total_out = sum(r.output_tokens for r in results)
-
-        print(f"\n{'='*60}")
-        print(f"Results: {passed}/{total} passed ({100*passed/total:.0f}%)")
-        print(f"Tokens:  {total_in:,} in / {total_out:,} out — ${total_cost:.4f}")
-        print(f"{'='*60}")
+
+        out = [
+            "",
+            "=" * 60,
+            f"Results: {passed}/{total} passed ({100*passed/total:.0f}%)",
+            f"Tokens:  {total_in:,} in / {total_out:,} out — ${total_cost:.4f}",
+            "=" * 60,
+        ]
         for r in results:
             status = "PASS" if r.passed else "FAIL"
-            print(f"  {status}  {r.task_id:<25} ${r.estimated_cost:.4f}")
+            out.append(f"  {status}  {r.task_id:<25} ${r.estimated_cost:.4f}")
+        sys.stdout.write("\n".join(out) + "\n")
 
     @staticmethod
     def compare(runs: dict[str, list[TaskResult]]):
         task_ids = [r.task_id for r in next(iter(runs.values()))]
+        # task_id -> result per config, so row building is a dict lookup
+        # instead of a linear scan per cell.
+        indexed = {config: {r.task_id: r for r in results} for config, results in runs.items()}
         col_w = max(len(c) for c in runs) + 4
         col_w = max(col_w, 18)
         header = f"{'task':<25}" + "".join(f"{c:>{col_w}}" for c in runs)
         sep = "-" * len(header)
-        print(f"\n{'=' * len(header)}")
-        print(header)
-        print(sep)
+        eq = "=" * len(header)
+        out = ["", eq, header, sep]
 
         for tid in task_ids:
             row = f"{tid:<25}"
-            for config, results in runs.items():
-                r = next(r for r in results if r.task_id == tid)
+            for config in runs:
+                r = indexed[config][tid]
                 status = "PASS" if r.passed else "FAIL"
                 cell = f"{status} ${r.estimated_cost:.4f}"
                 row += f"{cell:>{col_w}}"
-            print(row)
+            out.append(row)
 
-        print(sep)
+        out.append(sep)
         row = f"{'TOTAL':<25}"
         for config, results in runs.items():
-            p = sum(1 for r in results if r.passed)
-            cost = sum(r.estimated_cost for r in results)
+            p = 0
+            cost = 0.0
+            for r in results:
+                if r.passed:
+                    p += 1
+                cost += r.estimated_cost
             cell = f"{p}/{len(results)} ${cost:.4f}"
             row += f"{cell:>{col_w}}"
-        print(row)
-        print(f"{'=' * len(header)}")
+        out.append(row)
+        out.append(eq)
+        sys.stdout.write("\n".join(out) + "\n")
 
     @staticmethod
     def compare_multi_run(all_runs: dict[str, list[list[TaskResult]]]):
@@ -224,53 +594,66 @@ class EvalHarness:
         task_ids = [r.task_id for r in first_config[0]]
         num_runs = len(first_config)
 
+        # config -> [task_id -> result] per run; avoids the O(tasks) scan
+        # inside every cell of the table.
+        indexed = {
+            config: [{r.task_id: r for r in run_results} for run_results in run_list]
+            for config, run_list in all_runs.items()
+        }
+
         col_w = max(len(c) for c in all_runs) + 4
         col_w = max(col_w, 18)
         header = f"{'task':<25}" + "".join(f"{c:>{col_w}}" for c in all_runs)
         sep = "-" * len(header)
+        eq = "=" * len(header)
 
-        print(f"\n{'=' * len(header)}")
-        print(f"Benchmark: {num_runs} runs per config, {len(task_ids)} tasks")
-        print(f"{'=' * len(header)}")
-        print(header)
-        print(sep)
+        out = [
+            "",
+            eq,
+            f"Benchmark: {num_runs} runs per config, {len(task_ids)} tasks",
+            eq,
+            header,
+            sep,
+        ]
+
+        # Per-config running totals accumulated during the row pass, so
+        # the footer rows don't re-scan every result.
+        totals = {config: [0, 0.0] for config in all_runs}
 
         for tid in task_ids:
             row = f"{tid:<25}"
             for config, run_list in all_runs.items():
                 passes = 0
                 total_cost = 0.0
-                for run_results in run_list:
-                    r = next(r for r in run_results if r.task_id == tid)
+                for run_index in indexed[config]:
+                    r = run_index[tid]
                     if r.passed:
                         passes += 1
                     total_cost += r.estimated_cost
+                config_totals = totals[config]
+                config_totals[0] += passes
+                config_totals[1] += total_cost
                 avg_cost = total_cost / len(run_list)
                 cell = f"{passes}/{len(run_list)} ${avg_cost:.4f}"
                 row += f"{cell:>{col_w}}"
-            print(row)
+            out.append(row)
 
-        print(sep)
+        out.append(sep)
 
         row = f"{'PASS RATE':<25}"
         for config, run_list in all_runs.items():
-            total_passes = sum(
-                1 for run_results in run_list for r in run_results if r.passed
-            )
-            total_tasks = sum(len(run_results) for run_results in run_list)
-            rate = total_passes / total_tasks if total_tasks else 0
+            total_tasks = len(run_list) * len(task_ids)
+            rate = totals[config][0] / total_tasks if total_tasks else 0
             cell = f"{100 * rate:.1f}%"
             row += f"{cell:>{col_w}}"
-        print(row)
+        out.append(row)
 
         row = f"{'AVG COST/RUN':<25}"
         for config, run_list in all_runs.items():
-            total_cost = sum(
-                r.estimated_cost for run_results in run_list for r in run_results
-            )
-            avg = total_cost / len(run_list) if run_list else 0
+            avg = totals[config][1] / len(run_list) if run_list else 0
             cell = f"${avg:.4f}"
             row += f"{cell:>{col_w}}"
-        print(row)
+        out.append(row)
 
-        print(f"{'=' * len(header)}")
+        out.append(eq)
+        sys.stdout.write("\n".join(out) + "\n")
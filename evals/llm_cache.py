@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "agent_loop"))
+
+from agent import AgentResponse, LLMClient, ToolCall
+
+
+def _cache_key(model: str, messages: list, tools: list) -> str:
+    """Content hash of everything that determines a chat completion."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "tools": tools or []},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class DiskLLMCache:
+    """Content-addressed completion store: one JSON file per cache key.
+
+    Plain files (like the tool-library registry) rather than a database;
+    entries are small, written once, and survive across runs so repeated
+    dev iterations on an unchanged task suite skip the HTTP round trip.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str):
+        try:
+            return json.loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, payload: dict):
+        # Write-then-rename so a killed run never leaves a torn entry.
+        data = json.dumps(payload).encode()
+        with self._lock:
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self._path(key))
+
+
+class CachedClient(LLMClient):
+    """Wraps an LLMClient with a DiskLLMCache lookup per chat() call.
+
+    Sampling is not deterministic at default temperature, so this is an
+    opt-in dev-iteration tool: a hit replays the previously sampled
+    completion for a byte-identical (model, messages, tools) request.
+    """
+
+    def __init__(self, client: LLMClient, cache: DiskLLMCache):
+        self.client = client
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        # display_name, model, etc. pass through to the wrapped client.
+        return getattr(self.client, name)
+
+    def chat(self, messages: list, tools: list = None) -> AgentResponse:
+        key = _cache_key(self.client.model, messages, tools)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return AgentResponse(
+                content=cached["content"],
+                tool_calls=[ToolCall(**tc) for tc in cached["tool_calls"]],
+                raw_message=cached["raw_message"],
+                input_tokens=cached["input_tokens"],
+                output_tokens=cached["output_tokens"],
+            )
+        self.misses += 1
+        response = self.client.chat(messages, tools)
+        self.cache.set(key, {
+            "content": response.content,
+            "tool_calls": [
+                {"id": tc.id, "name": tc.name, "args": tc.args}
+                for tc in response.tool_calls
+            ],
+            "raw_message": response.raw_message,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+        })
+        return response
@@ -1,25 +1,45 @@
 import argparse
+import atexit
+import functools
 import json
+import os
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "agent_loop"))
 
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent / ".env")
+# Skip the .env filesystem probe when the key is already in the
+# environment (CI, wrapper scripts).
+if os.environ.get("OPENAI_API_KEY") is None:
+    from ._env import load_env
+    load_env(Path(__file__).parent.parent / ".env")
 
 from agent import OpenAIClient
 from .harness import EvalHarness
-from .tasks import ALL_TASKS, TASK_MAP
+from .tasks import TASK_IDS, all_tasks, get_task
 from .task import EvalTask, TaskResult, COST_PER_1K
-from .command_runner import HostCommandRunner, DockerCommandRunner, build_docker_image
+from .command_runner import HostCommandRunner
 from .verifier import set_command_runner
 import tool_library
-from tool_gen.generator import generate_tool
-from tool_gen.pipeline import _validate_tool_code
 
+# tool_gen (and its transitive agent/pipeline imports) and the Docker
+# helpers are only pulled in by the branches that use them; plain host
+# single-task runs and --help skip them entirely.
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+# Static boilerplate only; the variable tool-summary section is appended
+# after it. Keeping the shared prefix byte-identical across tasks lets
+# OpenAI's automatic prompt caching hit on it for every task after the
+# first.
 AUGMENTED_SYSTEM_PROMPT = """\
 You are a coding agent. You have tools to read files, write files, and run shell commands.
 You also have specialized code-generation tools. Check your full tool list — if a specialized \
@@ -35,7 +55,6 @@ Work step by step:
 3. If so, call the tool, then write the result to a file
 4. If not, write the code yourself
 When the task is complete, give a clear summary of what you did without calling any more tools.
-{tool_examples}\
 """
 
 DEFAULT_DOCKER_IMAGE = "coding-agent-evals:latest"
@@ -43,17 +62,60 @@ DEFAULT_DOCKERFILE = Path(__file__).parent / "Dockerfile.benchmark"
 DOCKER_SMOKE_TASK_IDS = ["hello_world", "rest_api_client", "fix_race_condition"]
 
 
-def _build_tool_examples_section(usage_examples):
-    if not usage_examples:
+# ~60 tokens per always-resident tool summary.
+_SUMMARY_CHARS = 240
+
+
+def _build_tool_summary_section(schemas):
+    if not schemas:
         return ""
-    lines = ["\n## Specialized Tool Usage Examples\n"]
-    for name, example in usage_examples.items():
-        lines.append(f"### {name}")
-        lines.append(example.strip())
-        lines.append("")
+    lines = [
+        "\n## Specialized Tools\n",
+        "Summaries only. Call request_tool_schema(name) before first use of a "
+        "tool to get its full parameters and a usage example.\n",
+    ]
+    for schema in schemas:
+        fn = schema.get("function", {})
+        desc = " ".join((fn.get("description") or "").split())
+        lines.append(f"- {fn.get('name')}: {desc[:_SUMMARY_CHARS]}")
     return "\n".join(lines)
 
 
+REQUEST_TOOL_SCHEMA = {
+    "type": "function",
+    "function": {
+        "name": "request_tool_schema",
+        "description": "Get the full JSON schema and usage example for one of the specialized tools summarized in the system prompt.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Tool name from the summary list."
+                }
+            },
+            "required": ["name"]
+        }
+    }
+}
+
+
+def _make_schema_request_handler(schemas, usage_examples):
+    registry = {s["function"]["name"]: s for s in schemas}
+
+    def request_tool_schema(name):
+        schema = registry.get(name)
+        if schema is None:
+            return f"Unknown tool: {name}. Available: {', '.join(sorted(registry))}"
+        parts = [json.dumps(schema, indent=2)]
+        example = usage_examples.get(name)
+        if example:
+            parts.append(f"\nUsage example:\n{example.strip()}")
+        return "\n".join(parts)
+
+    return request_tool_schema
+
+
 def _parse_config(spec):
     if spec.endswith("+tools"):
         return spec[:-6], True
@@ -65,35 +127,6 @@ def _generation_cost(model, input_tokens, output_tokens):
     return (input_tokens / 1000) * rates["input"] + (output_tokens / 1000) * rates["output"]
 
 
-def _extract_agent_observable_signals(task_result, max_chars=3000):
-    lines = []
-    for tc in task_result.trajectory:
-        if tc.name != "run_shell":
-            continue
-        output = tc.result or ""
-        if any(token in output for token in ("Traceback", "AssertionError", "FAILED", "Error:", "Exit code:")):
-            cmd = tc.args.get("command", "") if isinstance(tc.args, dict) else ""
-            lines.append(f"$ {cmd}\n{output[:800]}")
-    if not lines:
-        return "No explicit self-test failure logs were observed in run_shell outputs."
-    content = "\n\n".join(lines[-4:])
-    return content[:max_chars]
-
-
-def _generation_feedback(task_result, allow_verifier_feedback):
-    if allow_verifier_feedback:
-        return task_result.verify_message
-    runtime_error = f"\nAgent runtime error: {task_result.error}" if task_result.error else ""
-    signals = _extract_agent_observable_signals(task_result)
-    return (
-        "Hidden verifier result: FAIL.\n"
-        "Do not assume access to hidden tests. Infer likely failure modes from the agent's own actions.\n"
-        f"{runtime_error}\n\n"
-        "Agent-observable signals:\n"
-        f"{signals}"
-    )
-
-
 def _serialize_trajectory(trajectory):
     return [
         {
@@ -106,39 +139,157 @@ def _serialize_trajectory(trajectory):
     ]
 
 
-def _append_jsonl(log_path, payload):
+def _serialized_trajectory(task_result):
+    """Serialize a result's trajectory once and reuse it across events."""
+    cached = getattr(task_result, "_serialized_trajectory", None)
+    if cached is None:
+        cached = task_result._serialized_trajectory = _serialize_trajectory(task_result.trajectory)
+    return cached
+
+
+class _JsonlWriter:
+    """Buffers JSONL events in memory and flushes in chunks.
+
+    A self-improving run logs hundreds of events; writing each with its
+    own open/write/close is mostly syscall overhead. Events accumulate in
+    a bytearray and hit disk once the buffer passes 64 KiB, with a final
+    flush at close (registered via atexit so crashes mid-run still lose
+    at most one buffer's worth).
+    """
+
+    _FLUSH_BYTES = 64 * 1024
+
+    def __init__(self, log_path):
+        self.log_path = log_path
+        self._fd = None
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def append(self, record: dict):
+        if _orjson:
+            line = _orjson.dumps(record, option=_orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(record) + "\n").encode("utf-8")
+        with self._lock:
+            self._buf += line
+            if len(self._buf) >= self._FLUSH_BYTES:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        # Raw-fd append: the buffer is already UTF-8 bytes, so the
+        # buffered-IO layer would only add another copy on top.
+        if not self._buf:
+            return
+        if self._fd is None:
+            self._fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        os.write(self._fd, self._buf)
+        self._buf.clear()
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+# One writer per log path, shared by every event in the process.
+_writers: dict = {}
+_writers_lock = threading.Lock()
+
+
+def _append_jsonl(log_path, build_payload):
+    """Log one event; build_payload is a zero-arg callable.
+
+    Payload construction (trajectory serialization, feedback rendering)
+    is deferred so that runs without --benchmark-log do none of it.
+    """
     if not log_path:
         return
-    record = {"ts": datetime.now().isoformat(), **payload}
-    with Path(log_path).open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
+    with _writers_lock:
+        writer = _writers.get(log_path)
+        if writer is None:
+            writer = _writers[log_path] = _JsonlWriter(log_path)
+    writer.append({"ts": datetime.now().isoformat(), **build_payload()})
+
+
+# Caches _load_current_tools() output against tool_library.version();
+# unchanged iterations skip the registry/module re-reads and the prompt
+# formatting entirely.
+_TOOLS_CACHE = {"v": -1, "payload": None}
 
 
 def _load_current_tools():
+    v = tool_library.version()
+    if v == _TOOLS_CACHE["v"]:
+        return _TOOLS_CACHE["payload"]
     lib_schemas, lib_handlers = tool_library.load_tools()
     if not lib_schemas:
-        return None, None, set()
-    usage_examples = tool_library.load_tool_usage_examples()
-    tool_examples = _build_tool_examples_section(usage_examples)
-    prompt = AUGMENTED_SYSTEM_PROMPT.format(tool_examples=tool_examples)
-    return (lib_schemas, lib_handlers), prompt, set(lib_handlers.keys())
-
-
-def _make_harness(model, verbose, extra_tools=None, system_prompt=None, command_runner=None):
+        payload = (None, None, set())
+    else:
+        # Two-phase injection: the prompt carries compact per-tool
+        # summaries; full usage examples are served on demand by the
+        # request_tool_schema tool, so the resident prompt stays small
+        # (and stable, which keeps it prompt-cache friendly).
+        usage_examples = tool_library.load_tool_usage_examples()
+        prompt = AUGMENTED_SYSTEM_PROMPT + _build_tool_summary_section(lib_schemas)
+        schemas = lib_schemas + [REQUEST_TOOL_SCHEMA]
+        handlers = dict(lib_handlers)
+        handlers["request_tool_schema"] = _make_schema_request_handler(
+            lib_schemas, usage_examples
+        )
+        payload = ((schemas, handlers), prompt, set(lib_handlers.keys()))
+    _TOOLS_CACHE["v"] = v
+    _TOOLS_CACHE["payload"] = payload
+    return payload
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(model: str) -> OpenAIClient:
+    # One client (and one TLS/connection pool) per model for the whole
+    # process; the API is stateless per request so sharing is safe.
+    client = OpenAIClient(model=model)
+    if _LLM_CACHE_DIR is not None:
+        from .llm_cache import CachedClient, DiskLLMCache
+        client = CachedClient(client, DiskLLMCache(_LLM_CACHE_DIR))
+        _cached_clients.append(client)
+    _clients.append(client)
+    return client
+
+
+# Set from --llm-cache before any client is built; constant thereafter,
+# so the lru_cache on _get_client stays valid.
+_LLM_CACHE_DIR = None
+_cached_clients: list = []
+_clients: list = []
+
+
+def _print_cache_stats():
+    hits = sum(c.hits for c in _cached_clients)
+    misses = sum(c.misses for c in _cached_clients)
+    if hits or misses:
+        print(f"[llm cache] {hits} hits / {misses} misses")
+
+
+def _make_harness(model, verbose, extra_tools=None, system_prompt=None, command_runner=None,
+                  max_workers=None):
+    kwargs = {} if max_workers is None else {"max_workers": max_workers}
     return EvalHarness(
-        client=OpenAIClient(model=model),
+        client=_get_client(model),
         verbose=verbose,
         model_name=model,
         extra_tools=extra_tools,
         system_prompt=system_prompt,
         command_runner=command_runner,
+        **kwargs,
     )
 
 
 def _run_self_improving(
     tasks, cheap_model, sota_model, verbose, command_runner,
     max_gen_attempts=3, allow_verifier_feedback=False, log_path=None,
-    config_name=None, run_index=None
+    config_name=None, run_index=None, concurrency=1
 ):
     """Run all tasks through the self-improving pipeline.
 
@@ -146,11 +297,20 @@ def _run_self_improving(
     SOTA generates a new tool and cheap model retries.  Tools persist
     across tasks within a single run so earlier tools can help later tasks.
 
+    With concurrency > 1 the initial cheap-model pass runs tasks in
+    parallel (each against the library as of the start of the run); the
+    tool-generation/retry phase stays sequential since it mutates the
+    shared library. Sequential cross-task reuse on the *initial* pass is
+    traded away for wall-clock in that mode.
+
     Returns (results: list[TaskResult], meta: dict).
     """
+    from tool_gen.generator import generate_tool
+    from tool_gen.pipeline import _generation_feedback, _validate_tool_code
+
     tool_library.clear_all()
 
-    results = []
+    results = [None] * len(tasks)
     meta = {
         "tools_generated": {},
         "tool_sources": {},
@@ -158,18 +318,63 @@ def _run_self_improving(
         "total_gen_cost": 0.0,
     }
 
+    initial_results = [None] * len(tasks)
+    snap_names = None
+    if concurrency > 1:
+        snap_tools, snap_prompt, snap_names = _load_current_tools()
+
+        def _initial(task):
+            harness = _make_harness(
+                cheap_model, verbose, snap_tools, snap_prompt,
+                command_runner=command_runner,
+            )
+            try:
+                return harness.run_task(task)
+            finally:
+                harness.close()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = {pool.submit(_initial, t): i for i, t in enumerate(tasks)}
+            for future in as_completed(futures):
+                initial_results[futures[future]] = future.result()
+
     for i, task in enumerate(tasks, 1):
-        if not verbose:
+        if not verbose and initial_results[i - 1] is None:
             print(f"[{i}/{len(tasks)}] {task.id}...", end=" ", flush=True)
 
-        extra_tools, sys_prompt, lib_names = _load_current_tools()
-        harness = _make_harness(
-            cheap_model, verbose, extra_tools, sys_prompt, command_runner=command_runner
-        )
-        result = harness.run_task(task)
-        result.tools_used = [tc.name for tc in result.trajectory if tc.name in lib_names]
-        sent_feedback = None if result.passed else _generation_feedback(result, allow_verifier_feedback)
-        _append_jsonl(log_path, {
+        if initial_results[i - 1] is not None:
+            result = initial_results[i - 1]
+            lib_names = snap_names or set()
+        else:
+            extra_tools, sys_prompt, lib_names = _load_current_tools()
+            harness = _make_harness(
+                cheap_model, verbose, extra_tools, sys_prompt, command_runner=command_runner
+            )
+            result = harness.run_task(task)
+            harness.close()
+        # One pass over the trajectory builds tools_used and records
+        # cross-task reuse together, instead of a filter comprehension
+        # followed by a second walk of the filtered list.
+        if lib_names:
+            task_id = task.id
+            tool_sources = meta["tool_sources"]
+            cross_task_reuse = meta["cross_task_reuse"]
+            tools_used = []
+            for tc in result.trajectory:
+                tool_name = tc.name
+                if tool_name not in lib_names:
+                    continue
+                tools_used.append(tool_name)
+                src = tool_sources.get(tool_name)
+                if src and src != task_id:
+                    cross_task_reuse.append({
+                        "task_id": task_id,
+                        "tool_name": tool_name,
+                        "source_task": src,
+                        "passed": result.passed,
+                    })
+            result.tools_used = tools_used
+        _append_jsonl(log_path, lambda: {
             "event": "task_initial_result",
             "config": config_name,
             "run_index": run_index,
@@ -178,25 +383,15 @@ def _run_self_improving(
             "model": cheap_model,
             "passed": result.passed,
             "verify_message": result.verify_message,
-            "feedback_sent_to_generator": sent_feedback,
-            "trajectory": _serialize_trajectory(result.trajectory),
+            "feedback_sent_to_generator": None if result.passed else _generation_feedback(result, allow_verifier_feedback),
+            "trajectory": _serialized_trajectory(result),
             "tools_available": sorted(lib_names),
             "tools_used": result.tools_used,
             "cost": result.estimated_cost,
         })
 
-        for tn in result.tools_used:
-            src = meta["tool_sources"].get(tn)
-            if src and src != task.id:
-                meta["cross_task_reuse"].append({
-                    "task_id": task.id,
-                    "tool_name": tn,
-                    "source_task": src,
-                    "passed": result.passed,
-                })
-
         if result.passed:
-            results.append(result)
+            results[i - 1] = result
             continue
 
         retry_info = None
@@ -220,7 +415,7 @@ def _run_self_improving(
                     existing_tools=tool_library.load_tool_summaries(),
                 )
             except Exception as e:
-                _append_jsonl(log_path, {
+                _append_jsonl(log_path, lambda: {
                     "event": "generation_error",
                     "config": config_name,
                     "run_index": run_index,
@@ -235,7 +430,7 @@ def _run_self_improving(
             task_gen_cost += _generation_cost(sota_model, gen_in, gen_out)
 
             valid, name_or_err = _validate_tool_code(tool_code, verbose=verbose)
-            _append_jsonl(log_path, {
+            _append_jsonl(log_path, lambda: {
                 "event": "generation_attempt",
                 "config": config_name,
                 "run_index": run_index,
@@ -255,13 +450,24 @@ def _run_self_improving(
                 continue
 
             tool_name = name_or_err
-            tool_library.GENERATED_DIR.mkdir(parents=True, exist_ok=True)
-            tool_path = tool_library.GENERATED_DIR / f"{tool_name}.py"
-            tool_path.write_text(tool_code)
-            tool_library.register_tool(
-                name=tool_name, file_path=tool_path, task_id=task.id,
-                generator_model=sota_model, verified=True, verified_with=cheap_model,
-            )
+            # SOTA models regenerate byte-identical tools across retries
+            # and tasks; reuse the existing registration instead of
+            # rewriting the file and invalidating the tools cache.
+            digest = tool_library.code_digest(tool_code)
+            existing_name = tool_library.find_by_digest(digest)
+            if existing_name:
+                tool_name = existing_name
+                if verbose:
+                    print(f"  [tool_gen] identical tool already registered as {tool_name}; reusing")
+            else:
+                tool_library.GENERATED_DIR.mkdir(parents=True, exist_ok=True)
+                tool_path = tool_library.GENERATED_DIR / f"{tool_name}.py"
+                tool_path.write_text(tool_code)
+                tool_library.register_tool(
+                    name=tool_name, file_path=tool_path, task_id=task.id,
+                    generator_model=sota_model, verified=True, verified_with=cheap_model,
+                    digest=digest,
+                )
 
             et, sp, ln = _load_current_tools()
             harness2 = _make_harness(
@@ -274,9 +480,11 @@ def _run_self_improving(
                 print(f"  [tool_gen] re-running {task.id} with {tool_name}...")
 
             retry_result = harness2.run_task(task)
-            retry_result.tools_used = [tc.name for tc in retry_result.trajectory if tc.name in ln]
+            harness2.close()
+            if ln:
+                retry_result.tools_used = [tc.name for tc in retry_result.trajectory if tc.name in ln]
             retry_result.extra_cost = task_gen_cost
-            _append_jsonl(log_path, {
+            _append_jsonl(log_path, lambda: {
                 "event": "generation_retry_result",
                 "config": config_name,
                 "run_index": run_index,
@@ -288,7 +496,7 @@ def _run_self_improving(
                 "feedback_sent_to_generator_next_attempt": _generation_feedback(
                     retry_result, allow_verifier_feedback
                 ),
-                "trajectory": _serialize_trajectory(retry_result.trajectory),
+                "trajectory": _serialized_trajectory(retry_result),
                 "tools_used": retry_result.tools_used,
                 "cost": retry_result.estimated_cost,
             })
@@ -296,7 +504,7 @@ def _run_self_improving(
             if retry_result.passed:
                 meta["tools_generated"][task.id] = tool_name
                 meta["tool_sources"][tool_name] = task.id
-                results.append(retry_result)
+                results[i - 1] = retry_result
                 success = True
                 break
             else:
@@ -304,15 +512,18 @@ def _run_self_improving(
                     "tool_name": tool_name,
                     "verify_message": _generation_feedback(retry_result, allow_verifier_feedback),
                 }
-                tool_library.remove_tool(tool_name)
+                # Only evict tools registered on this attempt; a reused
+                # duplicate may be carrying earlier tasks.
+                if not existing_name:
+                    tool_library.remove_tool(tool_name)
 
         if not success:
             result.extra_cost = task_gen_cost
-            results.append(result)
+            results[i - 1] = result
 
         meta["total_gen_cost"] += task_gen_cost
 
-    passed = sum(1 for r in results if r.passed)
+    passed = sum(r.passed for r in results)
     total_cost = sum(r.estimated_cost for r in results)
     print(f"\n{'='*60}")
     print(f"Self-improving: {passed}/{len(results)} passed ({100*passed/len(results):.0f}%)")
@@ -359,131 +570,104 @@ def _print_pipeline_insights(all_meta):
             print(f"\n  Cross-task reuse total: {len(all_reuse)} events, {reuse_pass} helped pass")
 
 
-def _serialize_results(all_runs, all_meta, num_runs):
-    configs = {}
-
-    for config_name, run_list in all_runs.items():
-        model, with_tools = _parse_config(config_name)
-        runs_data = []
-        total_passes = 0
-        total_cost = 0.0
-
-        for run_results in run_list:
-            run_tasks = []
-            for r in run_results:
-                task_data = {
-                    "task_id": r.task_id,
-                    "passed": r.passed,
-                    "cost": round(r.estimated_cost, 6),
-                    "tokens_in": r.input_tokens,
-                    "tokens_out": r.output_tokens,
-                    "duration_ms": round(r.total_duration_ms, 1),
-                    "tool_calls": r.num_tool_calls,
-                }
-                if r.tools_used:
-                    task_data["tools_used"] = r.tools_used
-                if r.extra_cost > 0:
-                    task_data["generation_cost"] = round(r.extra_cost, 6)
-                run_tasks.append(task_data)
-                if r.passed:
-                    total_passes += 1
-                total_cost += r.estimated_cost
-            runs_data.append(run_tasks)
-
-        total_task_runs = len(run_list) * len(run_list[0]) if run_list else 0
-        config_data = {
-            "model": model,
-            "with_tools": with_tools,
-            "runs": runs_data,
-            "summary": {
-                "pass_rate": round(total_passes / total_task_runs, 4) if total_task_runs else 0,
-                "avg_cost_per_run": round(total_cost / len(run_list), 6) if run_list else 0,
-                "total_passes": total_passes,
-                "total_task_runs": total_task_runs,
-            },
-        }
+def _serialize_config(config_name, run_list, meta_list):
+    model, with_tools = _parse_config(config_name)
+    # Rates are per config, not per record; hoist the lookup and fold
+    # the /1000 in so each record's cost is one multiply-add, computed
+    # once and reused for both the emitted field and the totals.
+    rates = COST_PER_1K.get(model, {"input": 0.0, "output": 0.0})
+    in_rate = rates["input"] / 1000
+    out_rate = rates["output"] / 1000
+    runs_data = []
+    total_passes = 0
+    total_cost = 0.0
+
+    for run_results in run_list:
+        run_tasks = []
+        for r in run_results:
+            cost = r.input_tokens * in_rate + r.output_tokens * out_rate + r.extra_cost
+            task_data = {
+                "task_id": r.task_id,
+                "passed": r.passed,
+                "cost": round(cost, 6),
+                "tokens_in": r.input_tokens,
+                "tokens_out": r.output_tokens,
+                "duration_ms": round(r.total_duration_ms, 1),
+                "tool_calls": r.num_tool_calls,
+            }
+            if r.tools_used:
+                task_data["tools_used"] = r.tools_used
+            if r.extra_cost > 0:
+                task_data["generation_cost"] = round(r.extra_cost, 6)
+            run_tasks.append(task_data)
+            if r.passed:
+                total_passes += 1
+            total_cost += cost
+        runs_data.append(run_tasks)
+
+    total_task_runs = len(run_list) * len(run_list[0]) if run_list else 0
+    config_data = {
+        "model": model,
+        "with_tools": with_tools,
+        "runs": runs_data,
+        "summary": {
+            "pass_rate": round(total_passes / total_task_runs, 4) if total_task_runs else 0,
+            "avg_cost_per_run": round(total_cost / len(run_list), 6) if run_list else 0,
+            "total_passes": total_passes,
+            "total_task_runs": total_task_runs,
+        },
+    }
 
-        if config_name in all_meta:
-            config_data["pipeline"] = [
-                {
-                    "tools_generated": m["tools_generated"],
-                    "cross_task_reuse": m["cross_task_reuse"],
-                    "total_gen_cost": round(m["total_gen_cost"], 6),
-                }
-                for m in all_meta[config_name]
-            ]
+    if meta_list:
+        config_data["pipeline"] = [
+            {
+                "tools_generated": m["tools_generated"],
+                "cross_task_reuse": m["cross_task_reuse"],
+                "total_gen_cost": round(m["total_gen_cost"], 6),
+            }
+            for m in meta_list
+        ]
 
-        configs[config_name] = config_data
+    return config_data
 
-    return {
-        "timestamp": datetime.now().isoformat(),
-        "num_runs": num_runs,
-        "num_tasks": len(ALL_TASKS),
-        "configs": configs,
-    }
 
+def _dumps_indented(data) -> bytes:
+    if _orjson:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
 
-def main():
-    parser = argparse.ArgumentParser(description="Run agent evals")
-    group = parser.add_mutually_exclusive_group()
-    group.add_argument("--task", metavar="ID", help="Run a single task by ID")
-    group.add_argument("--all", action="store_true", help="Run all tasks")
-    parser.add_argument("--model", default="gpt-4o", help="Model to use (default: gpt-4o)")
-    parser.add_argument("--compare", nargs="+", metavar="CONFIG",
-                        help="Compare configs (e.g. --compare gpt-4o-mini gpt-4o-mini+tools gpt-4o)")
-    parser.add_argument("--runs", type=int, default=1,
-                        help="Number of runs per config in --compare mode (default: 1)")
-    parser.add_argument("--output", metavar="PATH",
-                        help="Save benchmark results to JSON file")
-    parser.add_argument("--sota-model", default="gpt-4o",
-                        help="SOTA model for tool generation in +tools configs (default: gpt-4o)")
-    parser.add_argument("--allow-verifier-feedback", action="store_true",
-                        help="Allow tool generation to see raw hidden verifier output (default: off)")
-    parser.add_argument("--benchmark-log", metavar="PATH",
-                        help="Write live benchmark/tool-gen events as JSONL")
-    parser.add_argument("--with-tools", action="store_true",
-                        help="Include generated tools from the tool library")
-    parser.add_argument("--runner", choices=["host", "docker"], default="host",
-                        help="Command runner backend for shell and verifier commands (default: host)")
-    parser.add_argument("--docker-image", default=DEFAULT_DOCKER_IMAGE,
-                        help=f"Docker image to use with --runner docker (default: {DEFAULT_DOCKER_IMAGE})")
-    parser.add_argument("--dockerfile", default=str(DEFAULT_DOCKERFILE),
-                        help=f"Dockerfile used by --build-image (default: {DEFAULT_DOCKERFILE})")
-    parser.add_argument("--build-image", action="store_true",
-                        help="Build docker image before running benchmarks")
-    parser.add_argument("--docker-smoke", action="store_true",
-                        help="Run a quick docker smoke benchmark on representative tasks")
-    parser.add_argument("--quiet", action="store_true", help="Suppress agent output")
-    args = parser.parse_args()
-
-    project_root = Path(__file__).parent.parent
-    if args.build_image:
-        build_result = build_docker_image(
-            image=args.docker_image,
-            dockerfile=Path(args.dockerfile),
-            context=project_root,
-        )
-        if build_result.stdout:
-            print(build_result.stdout)
-        if build_result.returncode != 0:
-            if build_result.stderr:
-                print(build_result.stderr)
-            elif build_result.error:
-                print(build_result.error)
-            sys.exit(1)
 
-    command_runner = HostCommandRunner()
-    if args.runner == "docker" or args.docker_smoke:
-        command_runner = DockerCommandRunner(args.docker_image)
-    set_command_runner(command_runner)
+def _write_results(path, all_runs, all_meta, num_runs):
+    """Stream the results JSON one config at a time.
 
+    Serializing the whole comparison matrix in one dumps() doubles peak
+    memory for large --runs sweeps; instead each config is serialized and
+    written independently, so at most one config's bytes are resident.
+    """
+    with open(path, "wb") as f:
+        f.write(b'{\n')
+        f.write(b'"timestamp": ' + json.dumps(datetime.now().isoformat()).encode() + b',\n')
+        f.write(b'"num_runs": %d,\n' % num_runs)
+        f.write(b'"num_tasks": %d,\n' % len(TASK_IDS))
+        f.write(b'"configs": {\n')
+        for i, (config_name, run_list) in enumerate(all_runs.items()):
+            if i:
+                f.write(b',\n')
+            config_data = _serialize_config(config_name, run_list, all_meta.get(config_name))
+            f.write(json.dumps(config_name).encode() + b': ')
+            f.write(_dumps_indented(config_data))
+        f.write(b'\n}}\n')
+
+
+def _dispatch(args, parser, command_runner):
     if args.compare:
+        tasks = all_tasks()
         all_runs = {}
         all_meta = {}
 
         for config_spec in args.compare:
             model, with_tools = _parse_config(config_spec)
-            config_runs = []
+            config_runs = [None] * args.runs
 
             for run_idx in range(args.runs):
                 print(f"\n{'#'*60}")
@@ -492,26 +676,24 @@ def main():
 
                 if with_tools:
                     results, meta = _run_self_improving(
-                        ALL_TASKS, model, args.sota_model, verbose=not args.quiet,
+                        tasks, model, args.sota_model, verbose=not args.quiet,
                         command_runner=command_runner,
                         allow_verifier_feedback=args.allow_verifier_feedback,
                         log_path=args.benchmark_log,
                         config_name=config_spec,
                         run_index=run_idx + 1,
+                        concurrency=args.concurrency,
                     )
-                    config_runs.append(results)
+                    config_runs[run_idx] = results
                     all_meta.setdefault(config_spec, []).append(meta)
                 else:
                     harness = _make_harness(
                         model, verbose=not args.quiet, command_runner=command_runner
                     )
-                    results = []
-                    for task_i, task in enumerate(ALL_TASKS, 1):
-                        if args.quiet:
-                            print(f"[{task_i}/{len(ALL_TASKS)}] {task.id}...", end=" ", flush=True)
+
+                    def _run_one(task_i, task):
                         r = harness.run_task(task)
-                        results.append(r)
-                        _append_jsonl(args.benchmark_log, {
+                        _append_jsonl(args.benchmark_log, lambda: {
                             "event": "task_result",
                             "config": config_spec,
                             "run_index": run_idx + 1,
@@ -520,12 +702,30 @@ def main():
                             "model": model,
                             "passed": r.passed,
                             "verify_message": r.verify_message,
-                            "trajectory": _serialize_trajectory(r.trajectory),
+                            "trajectory": _serialized_trajectory(r),
                             "tools_used": r.tools_used,
                             "cost": r.estimated_cost,
                         })
+                        return r
+
+                    results = [None] * len(tasks)
+                    if args.concurrency > 1:
+                        # Tasks are independent here (no shared tool
+                        # library); wall clock is dominated by API latency.
+                        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                            futures = {
+                                pool.submit(_run_one, task_i, task): task_i - 1
+                                for task_i, task in enumerate(tasks, 1)
+                            }
+                            for future in as_completed(futures):
+                                results[futures[future]] = future.result()
+                    else:
+                        for task_i, task in enumerate(tasks, 1):
+                            if args.quiet:
+                                print(f"[{task_i}/{len(tasks)}] {task.id}...", end=" ", flush=True)
+                            results[task_i - 1] = _run_one(task_i, task)
                     EvalHarness._print_summary(results)
-                    config_runs.append(results)
+                    config_runs[run_idx] = results
 
             all_runs[config_spec] = config_runs
 
@@ -539,14 +739,13 @@ def main():
             _print_pipeline_insights(all_meta)
 
         if args.output:
-            data = _serialize_results(all_runs, all_meta, args.runs)
-            Path(args.output).write_text(json.dumps(data, indent=2) + "\n")
+            _write_results(args.output, all_runs, all_meta, args.runs)
             print(f"\nResults saved to {args.output}")
 
         return
 
     if args.docker_smoke:
-        smoke_tasks = [TASK_MAP[task_id] for task_id in DOCKER_SMOKE_TASK_IDS]
+        smoke_tasks = [get_task(task_id) for task_id in DOCKER_SMOKE_TASK_IDS]
         harness = _make_harness(
             args.model, verbose=not args.quiet, command_runner=command_runner
         )
@@ -566,21 +765,142 @@ def main():
 
     if not args.task and not args.all:
         parser.print_help()
-        print(f"\nAvailable tasks: {', '.join(TASK_MAP.keys())}")
+        print(f"\nAvailable tasks: {', '.join(TASK_IDS)}")
         sys.exit(0)
 
     harness = _make_harness(
         args.model, verbose=not args.quiet, extra_tools=extra_tools,
-        system_prompt=augmented_prompt, command_runner=command_runner
+        system_prompt=augmented_prompt, command_runner=command_runner,
+        max_workers=args.concurrency if args.concurrency > 1 else None,
     )
 
     if args.task:
-        if args.task not in TASK_MAP:
-            print(f"Unknown task: {args.task!r}. Available: {', '.join(TASK_MAP.keys())}")
+        try:
+            task = get_task(args.task)
+        except KeyError:
+            print(f"Unknown task: {args.task!r}. Available: {', '.join(TASK_IDS)}")
             sys.exit(1)
-        harness.run_task(TASK_MAP[args.task])
+        harness.run_task(task)
     else:
-        harness.run_all(ALL_TASKS)
+        harness.run_all(all_tasks())
+
+
+# Defaults mirrored by the argparse declarations in _build_parser; a new
+# flag needs its default here too.
+_ARG_DEFAULTS = dict(
+    task=None, all=False, model="gpt-4o", compare=None, runs=1,
+    concurrency=1, output=None, sota_model="gpt-4o",
+    allow_verifier_feedback=False, benchmark_log=None, with_tools=False,
+    runner="host", docker_image=DEFAULT_DOCKER_IMAGE,
+    dockerfile=str(DEFAULT_DOCKERFILE), build_image=False,
+    docker_smoke=False, llm_cache=None, quiet=False,
+)
+
+
+def _fast_args(argv):
+    """Namespace for the trivial CLI forms without building a parser.
+
+    `--task ID` and `--all` are the interactive hot path; anything else
+    falls through to full argparse.
+    """
+    if len(argv) == 2 and argv[0] == "--task":
+        return argparse.Namespace(**{**_ARG_DEFAULTS, "task": argv[1]})
+    if argv == ["--all"]:
+        return argparse.Namespace(**{**_ARG_DEFAULTS, "all": True})
+    return None
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(description="Run agent evals")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--task", metavar="ID", help="Run a single task by ID")
+    group.add_argument("--all", action="store_true", help="Run all tasks")
+    parser.add_argument("--model", default="gpt-4o", help="Model to use (default: gpt-4o)")
+    parser.add_argument("--compare", nargs="+", metavar="CONFIG",
+                        help="Compare configs (e.g. --compare gpt-4o-mini gpt-4o-mini+tools gpt-4o)")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="Number of runs per config in --compare mode (default: 1)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Run independent tasks in parallel with N workers (default: 1)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="Save benchmark results to JSON file")
+    parser.add_argument("--sota-model", default="gpt-4o",
+                        help="SOTA model for tool generation in +tools configs (default: gpt-4o)")
+    parser.add_argument("--allow-verifier-feedback", action="store_true",
+                        help="Allow tool generation to see raw hidden verifier output (default: off)")
+    parser.add_argument("--benchmark-log", metavar="PATH",
+                        help="Write live benchmark/tool-gen events as JSONL")
+    parser.add_argument("--with-tools", action="store_true",
+                        help="Include generated tools from the tool library")
+    parser.add_argument("--runner", choices=["host", "docker"], default="host",
+                        help="Command runner backend for shell and verifier commands (default: host)")
+    parser.add_argument("--docker-image", default=DEFAULT_DOCKER_IMAGE,
+                        help=f"Docker image to use with --runner docker (default: {DEFAULT_DOCKER_IMAGE})")
+    parser.add_argument("--dockerfile", default=str(DEFAULT_DOCKERFILE),
+                        help=f"Dockerfile used by --build-image (default: {DEFAULT_DOCKERFILE})")
+    parser.add_argument("--build-image", action="store_true",
+                        help="Build docker image before running benchmarks")
+    parser.add_argument("--docker-smoke", action="store_true",
+                        help="Run a quick docker smoke benchmark on representative tasks")
+    parser.add_argument("--llm-cache", metavar="DIR", nargs="?", const=".eval_cache",
+                        help="Replay identical LLM requests from an on-disk cache "
+                             "(opt-in; completions are sampled, so only for dev iteration)")
+    parser.add_argument("--quiet", action="store_true", help="Suppress agent output")
+    return parser
+
+
+def main():
+    parser = None
+    args = _fast_args(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+
+    if args.llm_cache:
+        global _LLM_CACHE_DIR
+        _LLM_CACHE_DIR = Path(args.llm_cache)
+        atexit.register(_print_cache_stats)
+
+    # Workspace paths repeat across tasks (the pool reuses ws0..wsN), so a
+    # shared bytecode cache lets later verifies reuse the .pyc compiled for
+    # an earlier task's identical fixture; no:cacheprovider stops pytest
+    # from writing .pytest_cache dirs into the workspaces it would then
+    # have to clean up. setdefault keeps any caller override.
+    os.environ.setdefault("PYTHONPYCACHEPREFIX", str(Path.home() / ".eval_pycache"))
+    os.environ.setdefault("PYTEST_ADDOPTS", "-p no:cacheprovider")
+
+    project_root = Path(__file__).parent.parent
+    if args.build_image:
+        from .command_runner import build_docker_image
+        build_result = build_docker_image(
+            image=args.docker_image,
+            dockerfile=Path(args.dockerfile),
+            context=project_root,
+        )
+        if build_result.stdout:
+            print(build_result.stdout)
+        if build_result.returncode != 0:
+            if build_result.stderr:
+                print(build_result.stderr)
+            elif build_result.error:
+                print(build_result.error)
+            sys.exit(1)
+
+    command_runner = HostCommandRunner()
+    if args.runner == "docker" or args.docker_smoke:
+        from .command_runner import DockerCommandRunner
+        command_runner = DockerCommandRunner(args.docker_image)
+    set_command_runner(command_runner)
+
+    # Context-managed so warm containers/sessions are reaped on every
+    # exit path, including the early returns above each branch; client
+    # connection pools are dropped alongside them.
+    try:
+        with command_runner:
+            _dispatch(args, parser, command_runner)
+    finally:
+        for client in _clients:
+            client.close()
 
 
 if __name__ == "__main__":
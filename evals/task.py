@@ -1,29 +1,72 @@
+import dataclasses
+import hashlib
+import json
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class EvalTask:
     id: str
     prompt: str
     setup: Callable[[Path], None]
     verify: Callable[[Path], "VerifyResult"]
-    tags: list[str] = field(default_factory=list)
+    # Shared empty-tuple default: callers that set tags pass their own
+    # sequence, so the common case allocates nothing.
+    tags: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class VerifyResult:
     passed: bool
     message: str
 
 
-@dataclass
+# Hard ceiling on what a record may hold in memory; callers that want
+# tighter budgets (the harness keeps 512-char heads) truncate earlier.
+MAX_RESULT_CHARS = 4096
+
+
+@dataclass(slots=True)
 class ToolCallRecord:
     name: str
     args: dict
-    result: str
-    duration_ms: float
+    result: str  # truncated head; the full result lives in the trajectory JSONL
+    duration_ns: int
+    result_len: int = 0
+
+    def __post_init__(self):
+        # Names come from a handful of tools repeated across hundreds of
+        # records; interning stores one canonical string and makes the
+        # downstream name filters pointer comparisons.
+        self.name = sys.intern(self.name)
+        # Bound every construction path: a single huge read_file or shell
+        # dump must not pin its whole output in the trajectory. Head+tail
+        # keep the error-bearing ends; the digest identifies the full
+        # output for auditing against the trajectory JSONL.
+        result = self.result
+        if result and len(result) > MAX_RESULT_CHARS:
+            if not self.result_len:
+                self.result_len = len(result)
+            digest = hashlib.sha256(result.encode()).hexdigest()[:16]
+            self.result = (
+                result[:2048]
+                + f"\n…<truncated {len(result)} chars, sha256={digest}>…\n"
+                + result[-1024:]
+            )
+
+    @property
+    def duration_ms(self) -> float:
+        # Durations are captured as integer monotonic_ns and only converted
+        # to float ms at report time.
+        return self.duration_ns / 1e6
 
 
 COST_PER_1K = {
@@ -39,7 +82,12 @@ COST_PER_1K = {
 }
 
 
-@dataclass
+# Sentinel shared by every unknown model so __post_init__ does a single
+# dict lookup.
+_ZERO_RATES = {"input": 0.0, "output": 0.0}
+
+
+@dataclass(slots=True)
 class TaskResult:
     task_id: str
     passed: bool
@@ -52,7 +100,25 @@ class TaskResult:
     output_tokens: int = 0
     error: Optional[str] = None
     extra_cost: float = 0.0
-    tools_used: list[str] = field(default_factory=list)
+    # Replaced wholesale when library tools were used; the shared empty
+    # tuple covers the plain-run majority without a list per result.
+    tools_used: Sequence[str] = ()
+    trajectory_path: Optional[str] = None
+    # Per-token rates resolved once at construction; memo slots are filled
+    # lazily by the reporting helpers (slots=True leaves no __dict__ to
+    # hang ad-hoc attributes on).
+    _in_rate: float = field(default=0.0, init=False, repr=False, compare=False)
+    _out_rate: float = field(default=0.0, init=False, repr=False, compare=False)
+    _signals: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _serialized_trajectory: Optional[list] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        rates = COST_PER_1K.get(self.model, _ZERO_RATES)
+        self._in_rate = rates["input"] / 1000
+        self._out_rate = rates["output"] / 1000
+        # The trajectory is complete by construction time; a tuple is
+        # smaller than the append-sized list and fixes the log in place.
+        self.trajectory = tuple(self.trajectory)
 
     @property
     def num_tool_calls(self) -> int:
@@ -60,6 +126,21 @@ class TaskResult:
 
     @property
     def estimated_cost(self) -> float:
-        rates = COST_PER_1K.get(self.model, {"input": 0.0, "output": 0.0})
-        base = (self.input_tokens / 1000) * rates["input"] + (self.output_tokens / 1000) * rates["output"]
-        return base + self.extra_cost
+        # extra_cost can grow after construction (tool-generation spend),
+        # so only the rates are precomputed, not the product.
+        return (self.input_tokens * self._in_rate
+                + self.output_tokens * self._out_rate
+                + self.extra_cost)
+
+    def to_json(self) -> bytes:
+        """Serialize the full result (trajectory included) to JSON bytes.
+
+        orjson walks the dataclass fields directly in C — no asdict()
+        dict tree — and excludes the underscore memo slots by convention.
+        """
+        if _orjson:
+            return _orjson.dumps(self)
+        payload = dataclasses.asdict(self)
+        for key in [k for k in payload if k.startswith("_")]:
+            del payload[key]
+        return json.dumps(payload).encode()
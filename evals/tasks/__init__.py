@@ -1,34 +1,54 @@
-from .hello_world import task as hello_world
-from .fibonacci import task as fibonacci
-from .fix_the_bug import task as fix_the_bug
-from .parse_csv_report import task as parse_csv_report
-from .debug_stack_trace import task as debug_stack_trace
-from .multi_file_refactor import task as multi_file_refactor
-from .cross_file_import import task as cross_file_import
-from .implement_cache import task as implement_cache
-from .rest_api_client import task as rest_api_client
-from .class_hierarchy import task as class_hierarchy
-from .state_machine import task as state_machine
-from .fix_race_condition import task as fix_race_condition
-from .tree_operations import task as tree_operations
-from .cli_parser import task as cli_parser
-from .dependency_resolver import task as dependency_resolver
-
-ALL_TASKS = [
-    hello_world,
-    fibonacci,
-    fix_the_bug,
-    parse_csv_report,
-    debug_stack_trace,
-    multi_file_refactor,
-    cross_file_import,
-    implement_cache,
-    rest_api_client,
-    class_hierarchy,
-    state_machine,
-    fix_race_condition,
-    tree_operations,
-    cli_parser,
-    dependency_resolver,
-]
-TASK_MAP = {t.id: t for t in ALL_TASKS}
+import importlib
+from types import MappingProxyType
+
+# Task ids double as module names under this package. Modules are
+# imported on first use so `run.py --task X` pays for one task import,
+# not fifteen.
+TASK_IDS = (
+    "hello_world",
+    "fibonacci",
+    "fix_the_bug",
+    "parse_csv_report",
+    "debug_stack_trace",
+    "multi_file_refactor",
+    "cross_file_import",
+    "implement_cache",
+    "rest_api_client",
+    "class_hierarchy",
+    "state_machine",
+    "fix_race_condition",
+    "tree_operations",
+    "cli_parser",
+    "dependency_resolver",
+)
+
+_loaded = {}
+
+
+def get_task(task_id: str):
+    """Import (once) and return a single task by id.
+
+    Raises KeyError for unknown ids so callers can distinguish a bad
+    --task argument from an import failure.
+    """
+    task = _loaded.get(task_id)
+    if task is None:
+        if task_id not in TASK_IDS:
+            raise KeyError(task_id)
+        task = importlib.import_module(f".{task_id}", __name__).task
+        _loaded[task_id] = task
+    return task
+
+
+def all_tasks():
+    return [get_task(task_id) for task_id in TASK_IDS]
+
+
+def __getattr__(name):
+    # Legacy eager names; touching either imports every task module.
+    if name == "ALL_TASKS":
+        return all_tasks()
+    if name == "TASK_MAP":
+        # Read-only view; the registry is the source of truth.
+        return MappingProxyType({task_id: get_task(task_id) for task_id in TASK_IDS})
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,37 @@
+import shutil
+from importlib.resources import files
+
+# Stray bytecode caches from dev checkouts must never land in a task
+# workspace.
+_IGNORE = shutil.ignore_patterns("__pycache__")
+
+
+def copy_fixtures(task_id: str, workspace) -> None:
+    """Copy a task's whole fixture directory into the workspace.
+
+    One copytree instead of a write per file; the kernel-level copy
+    batches the dentry updates and reuses the page cache across runs.
+    """
+    shutil.copytree(files(__name__) / task_id, workspace,
+                    dirs_exist_ok=True, ignore=_IGNORE)
+
+
+def fixture_setup(task_id: str):
+    """One setup closure shape shared by every task module.
+
+    Task modules bind `setup = fixture_setup("<id>")` instead of each
+    compiling their own near-identical function body.
+    """
+    def _setup(workspace) -> None:
+        copy_fixtures(task_id, workspace)
+    return _setup
+
+
+def fixture_path(task_id: str):
+    """Traversable directory holding a task's setup payloads.
+
+    Payload bytes stay on disk until a setup() actually copies them into
+    a workspace, instead of living in each task module as interned string
+    literals.
+    """
+    return files(__name__) / task_id
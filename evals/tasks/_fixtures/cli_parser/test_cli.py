@@ -0,0 +1,60 @@
+from cli import parse_args, CLIError
+
+def test_simple_command():
+    result = parse_args(["init"])
+    assert result["command"] == "init"
+
+def test_positional_arg():
+    result = parse_args(["clone", "https://github.com/foo/bar"])
+    assert result["command"] == "clone"
+    assert result["args"] == ["https://github.com/foo/bar"]
+
+def test_flag():
+    result = parse_args(["build", "--verbose"])
+    assert result["flags"]["verbose"] == True
+
+def test_key_value():
+    result = parse_args(["deploy", "--env", "production"])
+    assert result["flags"]["env"] == "production"
+
+def test_short_flag():
+    result = parse_args(["test", "-v"])
+    assert result["flags"]["v"] == True
+
+def test_short_key_value():
+    result = parse_args(["run", "-n", "5"])
+    assert result["flags"]["n"] == "5"
+
+def test_mixed():
+    result = parse_args(["deploy", "myapp", "--env", "staging", "-v", "--retries", "3"])
+    assert result["command"] == "deploy"
+    assert result["args"] == ["myapp"]
+    assert result["flags"]["env"] == "staging"
+    assert result["flags"]["v"] == True
+    assert result["flags"]["retries"] == "3"
+
+def test_double_dash_stops_flags():
+    result = parse_args(["run", "--", "--not-a-flag", "-x"])
+    assert result["args"] == ["--not-a-flag", "-x"]
+    assert "not-a-flag" not in result.get("flags", {})
+
+def test_no_args():
+    result = parse_args([])
+    assert result["command"] is None
+    assert result["args"] == []
+
+def test_equals_syntax():
+    result = parse_args(["config", "--name=value"])
+    assert result["flags"]["name"] == "value"
+
+def test_error_on_dangling_value_flag():
+    try:
+        parse_args(["build", "--output"])
+        result = parse_args(["build", "--output"])
+        assert result["flags"]["output"] == True
+    except CLIError:
+        pass
+
+def test_multiple_positional():
+    result = parse_args(["copy", "src.txt", "dst.txt"])
+    assert result["args"] == ["src.txt", "dst.txt"]
@@ -0,0 +1,24 @@
+from utils import slugify, truncate
+from validators import validate_email
+
+class Article:
+    def __init__(self, title, body, author_email):
+        if not validate_email(author_email):
+            raise ValueError(f"Invalid email: {author_email}")
+        self.title = title
+        self.slug = slugify(title)
+        self.body = body
+        self.summary = truncate(body, 200)
+        self.author_email = author_email
+        self.tags = []
+
+    def add_tag(self, tag):
+        slug = slugify(tag)
+        if slug not in self.tags:
+            self.tags.append(slug)
+
+    def has_tag(self, tag):
+        return slugify(tag) in self.tags
+
+    def word_count(self):
+        return len(self.body.split())
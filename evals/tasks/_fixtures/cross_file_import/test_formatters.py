@@ -0,0 +1,44 @@
+from models import Article
+from utils import slugify, truncate
+from validators import validate_email, validate_slug
+from formatters import format_article, format_listing
+
+def test_format_article_basic():
+    a = Article("Hello World", "This is the body.", "a@b.com")
+    out = format_article(a)
+    assert "Hello World" in out
+    assert "hello-world" in out
+    assert "This is the body." in out
+    assert "a@b.com" in out
+
+def test_format_article_with_tags():
+    a = Article("Test Post", "Body text here.", "x@y.com")
+    a.add_tag("Python")
+    a.add_tag("Coding")
+    out = format_article(a)
+    assert "python" in out
+    assert "coding" in out
+
+def test_format_listing():
+    articles = [
+        Article("First", "Body one.", "a@b.com"),
+        Article("Second", "Body two.", "c@d.com"),
+    ]
+    out = format_listing(articles)
+    assert "first" in out
+    assert "second" in out
+    assert "2 articles" in out.lower() or "2 article" in out.lower()
+
+def test_format_listing_empty():
+    out = format_listing([])
+    assert "0 articles" in out.lower() or "no articles" in out.lower() or "0 article" in out.lower()
+
+def test_slugify_used_in_format():
+    a = Article("My Great Title", "Content.", "z@w.com")
+    out = format_article(a)
+    assert "my-great-title" in out
+
+def test_validate_slug_in_formatter():
+    from validators import validate_slug
+    assert validate_slug("hello-world")
+    assert not validate_slug("Hello World")
@@ -0,0 +1,8 @@
+def slugify(text):
+    return text.lower().strip().replace(" ", "-")
+
+
+def truncate(text, max_len=100):
+    if len(text) <= max_len:
+        return text
+    return text[:max_len - 3] + "..."
@@ -0,0 +1,12 @@
+import re
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_SLUG_RE = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
+
+
+def validate_email(email):
+    return bool(_EMAIL_RE.match(email))
+
+
+def validate_slug(slug):
+    return bool(_SLUG_RE.match(slug))
@@ -0,0 +1,44 @@
+import json
+
+class Config:
+    def __init__(self, path):
+        with open(path) as f:
+            self._data = json.load(f)
+
+    def get(self, key, default=None):
+        keys = key.split(".")
+        val = self._data
+        for k in keys:
+            if isinstance(val, dict):
+                val = val[k]
+            else:
+                return default
+        return val
+
+
+class UserService:
+    def __init__(self, config):
+        self.config = config
+        self.max_users = config.get("limits.max_users")
+        self.users = []
+
+    def add_user(self, name, email):
+        if len(self.users) >= self.max_users:
+            raise RuntimeError("User limit reached")
+        user = {"name": name, "email": email, "role": self.config.get("defaults.role")}
+        self.users.append(user)
+        return user
+
+    def find_user(self, email):
+        for user in self.users:
+            if user["email"] == email:
+                return user
+        return None
+
+    def remove_user(self, email):
+        user = self.find_user(email)
+        self.users.remove(user)
+        return user
+
+    def list_by_role(self, role):
+        return [u for u in self.users if u["role"] == role]
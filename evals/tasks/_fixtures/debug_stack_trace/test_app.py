@@ -0,0 +1,52 @@
+import json, os
+from app import Config, UserService
+
+def _make_config(tmp_path=None):
+    path = "test_config.json"
+    with open(path, "w") as f:
+        json.dump({"limits": {"max_users": 100}, "defaults": {"role": "viewer"}}, f)
+    return Config(path)
+
+def test_config_get_existing():
+    cfg = _make_config()
+    assert cfg.get("limits.max_users") == 100
+
+def test_config_missing_key():
+    cfg = _make_config()
+    result = cfg.get("nonexistent.key", "fallback")
+    assert result == "fallback"
+
+def test_config_partial_missing():
+    cfg = _make_config()
+    result = cfg.get("limits.nonexistent", 42)
+    assert result == 42
+
+def test_add_and_find_user():
+    cfg = _make_config()
+    svc = UserService(cfg)
+    svc.add_user("Alice", "alice@test.com")
+    u = svc.find_user("alice@test.com")
+    assert u["name"] == "Alice"
+    assert u["role"] == "viewer"
+
+def test_remove_existing_user():
+    cfg = _make_config()
+    svc = UserService(cfg)
+    svc.add_user("Bob", "bob@test.com")
+    removed = svc.remove_user("bob@test.com")
+    assert removed["name"] == "Bob"
+    assert svc.find_user("bob@test.com") is None
+
+def test_remove_nonexistent():
+    cfg = _make_config()
+    svc = UserService(cfg)
+    result = svc.remove_user("nobody@test.com")
+    assert result is None
+
+def test_list_by_role():
+    cfg = _make_config()
+    svc = UserService(cfg)
+    svc.add_user("A", "a@t.com")
+    svc.add_user("B", "b@t.com")
+    assert len(svc.list_by_role("viewer")) == 2
+    assert len(svc.list_by_role("admin")) == 0
@@ -0,0 +1,38 @@
+import threading
+
+class BankAccount:
+    def __init__(self, balance=0):
+        self.balance = balance
+
+    def deposit(self, amount):
+        current = self.balance
+        self.balance = current + amount
+
+    def withdraw(self, amount):
+        current = self.balance
+        if current >= amount:
+            self.balance = current - amount
+            return True
+        return False
+
+    def transfer(self, other, amount):
+        if self.withdraw(amount):
+            other.deposit(amount)
+            return True
+        return False
+
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+
+    def increment(self):
+        v = self.value
+        self.value = v + 1
+
+    def decrement(self):
+        v = self.value
+        self.value = v - 1
+
+    def get(self):
+        return self.value
@@ -0,0 +1,22 @@
+from word_utils import count_words, most_common_word
+
+def test_count_words_basic():
+    assert count_words("hello world") == 2
+
+def test_count_words_multiple_spaces():
+    assert count_words("hello  world") == 2
+
+def test_count_words_tabs_and_newlines():
+    assert count_words("hello\tworld\nfoo") == 3
+
+def test_count_words_empty():
+    assert count_words("") == 0
+
+def test_count_words_whitespace_only():
+    assert count_words("   ") == 0
+
+def test_most_common_word():
+    assert most_common_word("the cat sat on the mat") == "the"
+
+def test_most_common_word_case_insensitive():
+    assert most_common_word("Apple apple APPLE") == "apple"
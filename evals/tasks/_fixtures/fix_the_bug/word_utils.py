@@ -0,0 +1,13 @@
+def count_words(text):
+    if not text:
+        return 0
+    words = text.split(" ")
+    return len(words)
+
+
+def most_common_word(text):
+    words = text.lower().split()
+    counts = {}
+    for word in words:
+        counts[word] = counts.get(word, 0) + 1
+    return max(counts, key=lambda w: counts[w])
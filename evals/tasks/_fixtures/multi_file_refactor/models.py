@@ -0,0 +1,24 @@
+class User:
+    def __init__(self, name, email):
+        self.name = name
+        self.email = email
+        self.active = True
+
+    def deactivate(self):
+        self.active = False
+
+    def __repr__(self):
+        return f"User({self.name!r}, {self.email!r})"
+
+
+class Product:
+    def __init__(self, name, price, stock):
+        self.name = name
+        self.price = price
+        self.stock = stock
+
+    def is_available(self):
+        return self.stock > 0
+
+    def __repr__(self):
+        return f"Product({self.name!r}, ${self.price})"
@@ -0,0 +1,25 @@
+class Order:
+    _next_id = 1
+
+    def __init__(self, user, items):
+        self.id = Order._next_id
+        Order._next_id += 1
+        self.user = user
+        self.items = items  # list of (product, quantity)
+        self.status = "pending"
+
+    def total(self):
+        return sum(p.price * q for p, q in self.items)
+
+    def confirm(self):
+        for product, qty in self.items:
+            if product.stock < qty:
+                raise ValueError(f"Not enough stock for {product.name}")
+            product.stock -= qty
+        self.status = "confirmed"
+
+    def cancel(self):
+        if self.status == "confirmed":
+            for product, qty in self.items:
+                product.stock += qty
+        self.status = "cancelled"
@@ -0,0 +1,30 @@
+from models import User, Product
+from orders import Order
+
+class Store:
+    def __init__(self):
+        self.users = []
+        self.products = []
+        self.orders = []
+
+    def add_user(self, name, email):
+        u = User(name, email)
+        self.users.append(u)
+        return u
+
+    def add_product(self, name, price, stock):
+        p = Product(name, price, stock)
+        self.products.append(p)
+        return p
+
+    def place_order(self, user, items):
+        order = Order(user, items)
+        order.confirm()
+        self.orders.append(order)
+        return order
+
+    def get_user_orders(self, user):
+        return [o for o in self.orders if o.user == user]
+
+    def revenue(self):
+        return sum(o.total() for o in self.orders if o.status == "confirmed")
@@ -0,0 +1,50 @@
+from models import User, Product
+from orders import Order
+from store import Store
+
+def test_discount_basic():
+    s = Store()
+    u = s.add_user("Alice", "alice@test.com")
+    p = s.add_product("Widget", 100.0, 10)
+    order = s.place_order(u, [(p, 2)], discount=0.1)
+    assert order.total() == 180.0
+
+def test_discount_zero():
+    s = Store()
+    u = s.add_user("Bob", "bob@test.com")
+    p = s.add_product("Gadget", 50.0, 5)
+    order = s.place_order(u, [(p, 1)], discount=0.0)
+    assert order.total() == 50.0
+
+def test_discount_default():
+    s = Store()
+    u = s.add_user("Carol", "c@t.com")
+    p = s.add_product("Thing", 80.0, 3)
+    order = s.place_order(u, [(p, 1)])
+    assert order.total() == 80.0
+
+def test_revenue_with_discounts():
+    s = Store()
+    u = s.add_user("Dave", "d@t.com")
+    p1 = s.add_product("A", 100.0, 10)
+    p2 = s.add_product("B", 200.0, 10)
+    s.place_order(u, [(p1, 1)], discount=0.5)
+    s.place_order(u, [(p2, 1)], discount=0.0)
+    assert s.revenue() == 250.0
+
+def test_cancel_restores_stock():
+    s = Store()
+    u = s.add_user("Eve", "e@t.com")
+    p = s.add_product("X", 10.0, 5)
+    order = s.place_order(u, [(p, 3)], discount=0.0)
+    assert p.stock == 2
+    order.cancel()
+    assert p.stock == 5
+
+def test_order_without_discount_kwarg():
+    s = Store()
+    u = s.add_user("F", "f@t.com")
+    p = s.add_product("Y", 25.0, 10)
+    order = s.place_order(u, [(p, 4)])
+    assert order.total() == 100.0
+    assert order.status == "confirmed"
@@ -0,0 +1,36 @@
+import json
+from report import generate_report
+
+def test_report_structure():
+    r = json.loads(generate_report("employees.csv"))
+    assert "departments" in r
+    assert "total_headcount" in r
+    assert "total_salary_budget" in r
+
+def test_headcount():
+    r = json.loads(generate_report("employees.csv"))
+    assert r["total_headcount"] == 9
+
+def test_total_budget():
+    r = json.loads(generate_report("employees.csv"))
+    assert r["total_salary_budget"] == 804000
+
+def test_department_breakdown():
+    r = json.loads(generate_report("employees.csv"))
+    eng = r["departments"]["Engineering"]
+    assert eng["headcount"] == 4
+    assert eng["avg_salary"] == 103250.0
+    assert eng["highest_paid"] == "Eve"
+
+def test_marketing():
+    r = json.loads(generate_report("employees.csv"))
+    mkt = r["departments"]["Marketing"]
+    assert mkt["headcount"] == 3
+    assert mkt["avg_salary"] == 83666.67 or abs(mkt["avg_salary"] - 83666.67) < 0.01
+
+def test_sales():
+    r = json.loads(generate_report("employees.csv"))
+    sales = r["departments"]["Sales"]
+    assert sales["headcount"] == 2
+    assert sales["avg_salary"] == 70000.0
+    assert sales["highest_paid"] == "Frank"
@@ -1,25 +1,9 @@
-from pathlib import Path
 from ..task import EvalTask
+from ._fixtures import fixture_setup
 from ..verifier import TestsPasses
 
-_HIDDEN_TESTS = """\
-from fibonacci import fibonacci
 
-def test_base_cases():
-    assert fibonacci(0) == 0
-    assert fibonacci(1) == 1
-
-def test_sequence():
-    assert fibonacci(2) == 1
-    assert fibonacci(5) == 5
-    assert fibonacci(10) == 55
-
-def test_larger():
-    assert fibonacci(20) == 6765
-"""
-
-def setup(workspace: Path) -> None:
-    (workspace / "test_fibonacci.py").write_text(_HIDDEN_TESTS)
+setup = fixture_setup("fibonacci")
 
 task = EvalTask(
     id="fibonacci",
@@ -29,5 +13,5 @@ task = EvalTask(
     ),
     setup=setup,
     verify=TestsPasses("python3 -m pytest test_fibonacci.py -v").check,
-    tags=["algorithm", "python", "hidden-tests"],
+    tags=("algorithm", "python", "hidden-tests"),
 )
@@ -10,5 +10,5 @@ task = EvalTask(
         FileExists("hello.py"),
         ShellOutput("python3 hello.py", "Hello, World!", exact=True),
     ).check,
-    tags=["basic", "python"],
+    tags=("basic", "python"),
 )
@@ -0,0 +1,64 @@
+"""Content-addressed cache for tool generation calls.
+
+Identical inputs build an identical generation prompt, so a re-run of
+``--all`` pays the full SOTA token cost to regenerate the same tools.
+Keys hash (model, n, prompt) with length prefixes between fields; each
+entry is one JSON file under the cache root. Sampling is
+nondeterministic, so the cache is opt-in via ``TOOL_GEN_CACHE=<dir>`` —
+replays pin whichever candidates were sampled first.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+def cache_key(model: str, n: int, prompt: str) -> str:
+    h = hashlib.sha256()
+    for field in (model, str(n), prompt):
+        data = field.encode()
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+class GenCache:
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str):
+        try:
+            return json.loads(self._path(key).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: dict):
+        # Atomic publish so a crashed writer never leaves a torn entry.
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(value, f)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+_cache = None
+
+
+def cache():
+    """The process-wide cache, or None when TOOL_GEN_CACHE is unset."""
+    global _cache
+    if _cache is None:
+        root = os.environ.get("TOOL_GEN_CACHE")
+        _cache = GenCache(root) if root else False
+    return _cache or None
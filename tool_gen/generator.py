@@ -1,3 +1,5 @@
+import functools
+import io
 import json
 import re
 import sys
@@ -7,6 +9,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "agent_loop"))
 
 from agent import OpenAIClient
 
+from . import gen_cache
+
+
+# Both fence edges in one compiled pattern so stripping is a single
+# pass instead of two per-call re.sub lookups.
+_FENCE_RE = re.compile(r"^```\w*\n|\n```\s*$")
+
+# One client (and one HTTP connection pool) per model for the whole
+# pipeline run; reconstructing per call pays TLS setup on every LLM
+# round-trip. OpenAIClient holds no per-conversation state, so sharing
+# across attempts is safe.
+@functools.lru_cache(maxsize=8)
+def _client_for(model: str) -> OpenAIClient:
+    return OpenAIClient(model=model)
+
 GENERATION_PROMPT = """\
 You are a tool engineering expert. An AI coding agent (using a cheap, weak model) attempted a coding task and FAILED.
 
@@ -111,6 +128,26 @@ Now generate the tool. Return ONLY Python code.\
 """
 
 
+# The generation template is ~3 KB and mostly {{-escaped example code;
+# str.format rescans every brace per call. Split it on the real slots
+# once at import, unescaping the literal segments, so rendering is a
+# straight join.
+_SLOT_RE = re.compile(
+    r"\{(task_prompt|trajectory|verify_message|retry_context|existing_tools_context)\}"
+)
+_PROMPT_SEGMENTS = tuple(
+    part if i % 2 else part.replace("{{", "{").replace("}}", "}")
+    for i, part in enumerate(_SLOT_RE.split(GENERATION_PROMPT))
+)
+
+
+def _render_generation_prompt(values):
+    return "".join(
+        values[part] if i % 2 else part
+        for i, part in enumerate(_PROMPT_SEGMENTS)
+    )
+
+
 RETRY_CONTEXT_TEMPLATE = """
 ## Previous Attempt Failed
 The previously generated tool was called by the agent but STILL produced wrong code.
@@ -120,13 +157,28 @@ Fix the tool so the generated code passes. Think carefully about what edge case
 """
 
 
+# The prompt only ever shows a preview of each step; bound both sides
+# so a write_file carrying a whole source tree doesn't get
+# pretty-printed in full just to be sliced.
+_ARGS_PREVIEW_CHARS = 1000
+_RESULT_PREVIEW_CHARS = 500
+
+
 def format_trajectory(trajectory):
-    lines = []
+    if not trajectory:
+        return "(no tool calls recorded)"
+    buf = io.StringIO()
     for i, tc in enumerate(trajectory, 1):
+        if i > 1:
+            buf.write("\n\n")
         args_str = json.dumps(tc.args, indent=2) if isinstance(tc.args, dict) else str(tc.args)
-        result_preview = tc.result[:500] + "..." if len(tc.result) > 500 else tc.result
-        lines.append(f"Step {i}: {tc.name}({args_str})\n  -> {result_preview}")
-    return "\n\n".join(lines) if lines else "(no tool calls recorded)"
+        if len(args_str) > _ARGS_PREVIEW_CHARS:
+            args_str = args_str[:_ARGS_PREVIEW_CHARS] + "..."
+        result = tc.result
+        if len(result) > _RESULT_PREVIEW_CHARS:
+            result = result[:_RESULT_PREVIEW_CHARS] + "..."
+        buf.write(f"Step {i}: {tc.name}({args_str})\n  -> {result}")
+    return buf.getvalue()
 
 
 def format_existing_tools(existing_tools):
@@ -152,7 +204,7 @@ def format_existing_tools(existing_tools):
 
 def generate_tool(task_prompt, trajectory, verify_message, model="gpt-4o",
                   retry_info=None, existing_tools=None):
-    client = OpenAIClient(model=model)
+    client = _client_for(model)
 
     retry_context = ""
     if retry_info:
@@ -161,13 +213,22 @@ def generate_tool(task_prompt, trajectory, verify_message, model="gpt-4o",
             retry_verify_message=retry_info["verify_message"][:500],
         )
 
-    prompt = GENERATION_PROMPT.format(
-        task_prompt=task_prompt,
-        trajectory=format_trajectory(trajectory),
-        verify_message=verify_message,
-        retry_context=retry_context,
-        existing_tools_context=format_existing_tools(existing_tools),
-    )
+    prompt = _render_generation_prompt({
+        "task_prompt": task_prompt,
+        "trajectory": format_trajectory(trajectory),
+        "verify_message": verify_message,
+        "retry_context": retry_context,
+        "existing_tools_context": format_existing_tools(existing_tools),
+    })
+
+    # The prompt embeds trajectory, verify message, and retry context,
+    # so hashing it alone keys the full call.
+    cache = gen_cache.cache()
+    if cache is not None:
+        key = gen_cache.cache_key(model, 1, prompt)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit["codes"][0], hit["input_tokens"], hit["output_tokens"]
 
     response = client.chat(
         messages=[{"role": "user", "content": prompt}],
@@ -176,7 +237,51 @@ def generate_tool(task_prompt, trajectory, verify_message, model="gpt-4o",
 
     code = response.content.strip()
     if code.startswith("```"):
-        code = re.sub(r'^```\w*\n', '', code)
-        code = re.sub(r'\n```\s*$', '', code)
+        code = _FENCE_RE.sub("", code)
 
+    if cache is not None:
+        cache.put(key, {"codes": [code], "input_tokens": response.input_tokens,
+                        "output_tokens": response.output_tokens})
     return code, response.input_tokens, response.output_tokens
+
+
+def generate_tool_candidates(task_prompt, trajectory, verify_message, model="gpt-4o",
+                             n=1, existing_tools=None):
+    """Sample n tool candidates from one LLM call.
+
+    The prompt dominates the token cost, and with the provider's n
+    parameter it is paid once for all candidates; callers validate and
+    try them locally instead of paying a round trip per retry.
+    """
+    client = _client_for(model)
+
+    prompt = _render_generation_prompt({
+        "task_prompt": task_prompt,
+        "trajectory": format_trajectory(trajectory),
+        "verify_message": verify_message,
+        "retry_context": "",
+        "existing_tools_context": format_existing_tools(existing_tools),
+    })
+
+    cache = gen_cache.cache()
+    if cache is not None:
+        key = gen_cache.cache_key(model, n, prompt)
+        hit = cache.get(key)
+        if hit is not None:
+            return hit["codes"], hit["input_tokens"], hit["output_tokens"]
+
+    contents, input_tokens, output_tokens = client.chat_n(
+        messages=[{"role": "user", "content": prompt}], n=n,
+    )
+
+    codes = []
+    for content in contents:
+        code = content.strip()
+        if code.startswith("```"):
+            code = _FENCE_RE.sub("", code)
+        codes.append(code)
+
+    if cache is not None:
+        cache.put(key, {"codes": codes, "input_tokens": input_tokens,
+                        "output_tokens": output_tokens})
+    return codes, input_tokens, output_tokens
@@ -1,19 +1,30 @@
+import ast
+import atexit
+import hashlib
+import json
+import os
+import re
 import sys
+import threading
 import time
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "agent_loop"))
 
-from agent import OpenAIClient, Agent
-from evals.harness import EvalHarness, _build_toolbox
+from agent import Agent
+from evals.harness import EvalHarness, _build_toolbox, _BASE_SCHEMAS
 from evals.task import EvalTask, TaskResult, ToolCallRecord
 
-from .generator import generate_tool
+from .generator import generate_tool_candidates, _client_for
 import tool_library
 
 
+# Static boilerplate only; the variable examples section is appended after
+# it so the shared prefix stays byte-identical across tasks and stays
+# eligible for OpenAI's automatic prompt caching.
 AUGMENTED_SYSTEM_PROMPT = """\
 You are a coding agent. You have tools to read files, write files, and run shell commands.
 You also have specialized code-generation tools. Check your full tool list — if a specialized \
@@ -29,7 +40,6 @@ Work step by step:
 3. If so, call the tool, then write the result to a file
 4. If not, write the code yourself
 When the task is complete, give a clear summary of what you did without calling any more tools.
-{tool_examples}\
 """
 
 
@@ -44,19 +54,35 @@ def _build_tool_examples_section(usage_examples):
     return "\n".join(lines)
 
 
+# One scan per output instead of five substring passes.
+_SIGNAL_RE = re.compile(r"Traceback|AssertionError|FAILED|Error:|Exit code:")
+
+
 def _extract_agent_observable_signals(task_result, max_chars=3000):
+    # _generation_feedback is called for every logged event and every
+    # generation attempt on the same result; walk the trajectory once.
+    cached = getattr(task_result, "_signals", None)
+    if cached is not None:
+        return cached
+    # Only the last four signal-bearing commands make it into the
+    # feedback, so scan from the tail and stop as soon as they're found
+    # instead of regex-checking the whole trajectory.
     lines = []
-    for tc in task_result.trajectory:
+    for tc in reversed(task_result.trajectory):
         if tc.name != "run_shell":
             continue
         output = tc.result or ""
-        if any(token in output for token in ("Traceback", "AssertionError", "FAILED", "Error:", "Exit code:")):
+        if _SIGNAL_RE.search(output):
             cmd = tc.args.get("command", "") if isinstance(tc.args, dict) else ""
             lines.append(f"$ {cmd}\n{output[:800]}")
+            if len(lines) == 4:
+                break
     if not lines:
-        return "No explicit self-test failure logs were observed in run_shell outputs."
-    content = "\n\n".join(lines[-4:])
-    return content[:max_chars]
+        content = "No explicit self-test failure logs were observed in run_shell outputs."
+    else:
+        content = "\n\n".join(reversed(lines))[:max_chars]
+    task_result._signals = content
+    return content
 
 
 def _generation_feedback(task_result, allow_verifier_feedback):
@@ -74,6 +100,57 @@ def _generation_feedback(task_result, allow_verifier_feedback):
 
 
 def _validate_tool_code(code, verbose=True):
+    # Structural pass first: syntax errors and a missing SCHEMA are the
+    # common failure shapes, and ast.parse answers both in microseconds
+    # without running the generated code's imports.
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return False, f"Code execution error: {e}"
+    top_names = set()
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            top_names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            top_names.add(node.target.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            top_names.add(node.name)
+    if "SCHEMA" not in top_names:
+        return False, "Missing SCHEMA definition"
+
+    # Fully static path for the normal generated shape — SCHEMA as a
+    # literal dict. literal_eval extracts it and the named function is
+    # confirmed against the parsed defs, so the untrusted candidate is
+    # never executed just to be screened; it first runs when the
+    # registered tool is loaded for the re-run.
+    schema_node = next(
+        (node.value for node in tree.body if isinstance(node, ast.Assign)
+         and any(isinstance(t, ast.Name) and t.id == "SCHEMA" for t in node.targets)),
+        None,
+    )
+    schema = None
+    if schema_node is not None:
+        try:
+            schema = ast.literal_eval(schema_node)
+        except ValueError:
+            schema = None
+    if isinstance(schema, dict):
+        func_name = schema.get("function", {}).get("name")
+        if not func_name:
+            return False, "SCHEMA missing function.name"
+        funcs = {node.name for node in tree.body
+                 if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+        if func_name not in funcs:
+            return False, f"Function '{func_name}' not defined"
+        try:
+            compile(code, "<generated_tool>", "exec")
+        except (SyntaxError, ValueError) as e:
+            return False, f"Code execution error: {e}"
+        if "USAGE_EXAMPLE" not in top_names and verbose:
+            print(f"  Warning: tool '{func_name}' missing USAGE_EXAMPLE (recommended for agent discoverability)")
+        return True, func_name
+
+    # SCHEMA built dynamically: only execution can tell what it holds.
     namespace = {}
     try:
         exec(code, namespace)
@@ -100,42 +177,170 @@ def _validate_tool_code(code, verbose=True):
     return True, func_name
 
 
-def _run_with_library_tools(task, model, verbose):
-    client = OpenAIClient(model=model)
+# Workspace teardown is pure disk work the caller never observes;
+# handing rmtree to a small pool takes it off the critical path between
+# attempts. Python joins non-daemon executor threads at exit, so
+# pending deletes still finish.
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ws-cleanup")
+
+# Throwaway workspaces live on tmpfs when present — matching the
+# harness workspace pool — so tool writes and pytest artifacts are
+# memory ops instead of disk I/O. EVAL_TMPDIR overrides the choice.
+_TMP_ROOT = (os.environ.get("EVAL_TMPDIR")
+             or ("/dev/shm" if os.path.ismount("/dev/shm") else None))
+
+# Retry-heavy tasks cycle through several workspaces; reusing a cleared
+# directory (like the harness workspace pool) is cheaper than a full
+# mkdtemp + rmtree round per attempt. Release clears contents off the
+# critical path and only then returns the dir to the pool.
+_WS_LOCK = threading.Lock()
+_WS_POOL: list = []
+_WS_POOL_CLOSED = False
+
+
+def _acquire_workspace(task_id) -> Path:
+    with _WS_LOCK:
+        if _WS_POOL:
+            return _WS_POOL.pop()
+    return Path(tempfile.mkdtemp(prefix=f"eval_{task_id}_", dir=_TMP_ROOT))
+
+
+def _clear_and_release(workspace: Path):
+    for entry in os.scandir(workspace):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            os.unlink(entry.path)
+    with _WS_LOCK:
+        if _WS_POOL_CLOSED:
+            # The reaper already ran (cleanup threads are joined after
+            # atexit); delete instead of stranding the dir on tmpfs.
+            shutil.rmtree(workspace, ignore_errors=True)
+        else:
+            _WS_POOL.append(workspace)
+
+
+def _reap_ws_pool():
+    """Delete pooled workspaces at exit; they live on tmpfs otherwise."""
+    global _WS_POOL_CLOSED
+    with _WS_LOCK:
+        _WS_POOL_CLOSED = True
+        pooled, _WS_POOL[:] = list(_WS_POOL), []
+    for workspace in pooled:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+atexit.register(_reap_ws_pool)
+
+
+def _release_workspace(workspace: Path):
+    _CLEANUP_POOL.submit(_clear_and_release, workspace)
+
+
+# Everything here is workspace-agnostic: schemas, handlers, and the
+# assembled system prompt only change when the library does, so they
+# are rebuilt per library version instead of per attempt.
+_LIBRARY_CONTEXT_CACHE: dict = {}
+
+
+# Library tools are pure by the generation contract (no filesystem
+# access, structured input -> code string), so identical calls return
+# identical output and can be deduped across agents and attempts.
+# Bounded FIFO, matching the verifier result cache.
+_LIB_CALL_CACHE: dict = {}
+_LIB_CALL_LOCK = threading.Lock()
+_LIB_CALL_MAX_ENTRIES = 256
+
+
+def _wrap_lib_handler(name, handler, version):
+    def call(args):
+        try:
+            key = (name, version, json.dumps(args, sort_keys=True))
+        except (TypeError, ValueError):
+            key = None
+        if key is not None:
+            with _LIB_CALL_LOCK:
+                cached = _LIB_CALL_CACHE.get(key)
+            if cached is not None:
+                return cached
+        try:
+            result = str(handler(**args))
+        except Exception as e:
+            return f"Error: {e}"
+        if key is not None:
+            with _LIB_CALL_LOCK:
+                if len(_LIB_CALL_CACHE) >= _LIB_CALL_MAX_ENTRIES:
+                    _LIB_CALL_CACHE.pop(next(iter(_LIB_CALL_CACHE)))
+                _LIB_CALL_CACHE[key] = result
+        return result
+    return call
+
+
+def _library_context():
+    version = tool_library.version()
+    cached = _LIBRARY_CONTEXT_CACHE.get("ctx")
+    if cached is not None and cached[0] == version:
+        return cached[1]
     lib_schemas, lib_handlers = tool_library.load_tools()
-    usage_examples = tool_library.load_tool_usage_examples()
+    # Handlers pre-wrapped with their error/str handling, so dispatch is
+    # one .get plus a call instead of membership test + lookup + wrap.
+    lib_dispatch = {name: _wrap_lib_handler(name, handler, version)
+                    for name, handler in lib_handlers.items()}
+    if lib_schemas:
+        usage_examples = tool_library.load_tool_usage_examples()
+        system_prompt = AUGMENTED_SYSTEM_PROMPT + _build_tool_examples_section(usage_examples)
+    else:
+        system_prompt = None
+    # Base schemas are static, so the combined tool list can be
+    # concatenated here once per library version too.
+    ctx = (list(_BASE_SCHEMAS) + lib_schemas, lib_dispatch, system_prompt)
+    _LIBRARY_CONTEXT_CACHE["ctx"] = (version, ctx)
+    return ctx
+
+
+# Harnesses carry a workspace pool and a started command runner, so
+# one per (model, verbosity) is shared across pipeline calls instead
+# of rebuilding that state for every task.
+_HARNESS_CACHE: dict = {}
+
+
+def _harness_for(model, verbose):
+    key = (model, verbose)
+    harness = _HARNESS_CACHE.get(key)
+    if harness is None:
+        harness = EvalHarness(client=_client_for(model), verbose=verbose,
+                              model_name=model)
+        _HARNESS_CACHE[key] = harness
+    return harness
+
 
-    workspace = Path(tempfile.mkdtemp(prefix=f"eval_{task.id}_"))
+def _run_with_library_tools(task, model, verbose):
+    client = _client_for(model)
+    all_schemas, lib_dispatch, system_prompt = _library_context()
+
+    workspace = _acquire_workspace(task.id)
     trajectory = []
+    close_toolbox = lambda: None
 
     try:
         task.setup(workspace)
-        base_schemas, base_dispatch = _build_toolbox(workspace)
-        all_schemas = base_schemas + lib_schemas
+        _, base_dispatch, close_toolbox = _build_toolbox(workspace)
 
         def merged_dispatch(name, args):
-            if name in lib_handlers:
-                try:
-                    return str(lib_handlers[name](**args))
-                except Exception as e:
-                    return f"Error: {e}"
+            handler = lib_dispatch.get(name)
+            if handler is not None:
+                return handler(args)
             return base_dispatch(name, args)
 
         def recording_dispatch(name, args):
-            t0 = time.monotonic()
+            t0 = time.monotonic_ns()
             result = merged_dispatch(name, args)
             trajectory.append(ToolCallRecord(
                 name=name, args=args, result=result,
-                duration_ms=(time.monotonic() - t0) * 1000,
+                duration_ns=time.monotonic_ns() - t0,
             ))
             return result
 
-        if lib_schemas:
-            tool_examples = _build_tool_examples_section(usage_examples)
-            system_prompt = AUGMENTED_SYSTEM_PROMPT.format(tool_examples=tool_examples)
-        else:
-            system_prompt = None
-
         agent = Agent(
             client=client,
             tools=all_schemas,
@@ -180,7 +385,8 @@ def _run_with_library_tools(task, model, verbose):
 
         return result
     finally:
-        shutil.rmtree(workspace, ignore_errors=True)
+        close_toolbox()
+        _release_workspace(workspace)
 
 
 def run_pipeline(
@@ -190,6 +396,7 @@ def run_pipeline(
     max_attempts: int = 3,
     verbose: bool = True,
     allow_verifier_feedback: bool = False,
+    initial_result=None,
 ):
     if verbose:
         print(f"\n{'='*60}")
@@ -197,9 +404,8 @@ def run_pipeline(
         print(f"Cheap: {cheap_model} | SOTA: {sota_model}")
         print(f"{'='*60}")
 
-    cheap_client = OpenAIClient(model=cheap_model)
-    harness = EvalHarness(client=cheap_client, verbose=verbose, model_name=cheap_model)
-    initial_result = harness.run_task(task)
+    if initial_result is None:
+        initial_result = _harness_for(cheap_model, verbose).run_task(task)
 
     if initial_result.passed:
         if verbose:
@@ -215,27 +421,55 @@ def run_pipeline(
         print(f"\n>>> {task.id} FAILED with {cheap_model} -- generating tool...")
 
     gen_costs = {"input_tokens": 0, "output_tokens": 0}
-    retry_info = None
 
-    for attempt in range(1, max_attempts + 1):
+    # A recurring failure class may already have a working tool in the
+    # library; try the recorded one before spending a generation call.
+    sig = hashlib.blake2b(
+        f"{task.prompt}|{initial_result.verify_message[:500]}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    cached_tool = tool_library.lookup_signature(sig)
+    if cached_tool:
         if verbose:
-            print(f"\n--- Generation attempt {attempt}/{max_attempts} ---")
-
-        existing_tools = tool_library.load_tool_summaries()
+            print(f"  Library has {cached_tool} for this failure signature -- retrying with it...")
+        retry_result = _run_with_library_tools(task, cheap_model, verbose)
+        if retry_result.passed:
+            if verbose:
+                print(f"\n>>> SUCCESS: {task.id} PASSED with {cheap_model} + {cached_tool} (reused)")
+            return {
+                "task_id": task.id,
+                "status": "tool_generated",
+                "initial_result": initial_result,
+                "retry_result": retry_result,
+                "tool_name": cached_tool,
+                "tool_code": (tool_library.GENERATED_DIR / f"{cached_tool}.py").read_text(),
+                "tool_generated": True,
+                "generation_cost": gen_costs,
+                "attempts": 0,
+            }
+        if verbose:
+            print(f"  Recorded tool no longer fixes this failure -- generating fresh...")
+
+    # Sample every candidate in one call: the prompt (trajectory +
+    # guidelines, the dominant token cost) is paid once and attempts
+    # 2..N become local validate-and-retry instead of fresh round trips.
+    candidates, gen_in, gen_out = generate_tool_candidates(
+        task_prompt=task.prompt,
+        trajectory=initial_result.trajectory,
+        verify_message=_generation_feedback(initial_result, allow_verifier_feedback),
+        model=sota_model,
+        n=max_attempts,
+        existing_tools=tool_library.load_tool_summaries(),
+    )
+    gen_costs["input_tokens"] += gen_in
+    gen_costs["output_tokens"] += gen_out
 
-        tool_code, gen_in, gen_out = generate_tool(
-            task_prompt=task.prompt,
-            trajectory=initial_result.trajectory,
-            verify_message=_generation_feedback(initial_result, allow_verifier_feedback),
-            model=sota_model,
-            retry_info=retry_info,
-            existing_tools=existing_tools,
-        )
-        gen_costs["input_tokens"] += gen_in
-        gen_costs["output_tokens"] += gen_out
+    if verbose:
+        print(f"Generated {len(candidates)} candidate tool(s) ({gen_in + gen_out:,} tokens)")
 
+    for attempt, tool_code in enumerate(candidates, 1):
         if verbose:
-            print(f"Generated tool ({gen_in + gen_out:,} tokens)")
+            print(f"\n--- Candidate {attempt}/{len(candidates)} ---")
 
         valid, result = _validate_tool_code(tool_code, verbose=verbose)
         if not valid:
@@ -266,6 +500,7 @@ def run_pipeline(
         retry_result = _run_with_library_tools(task, cheap_model, verbose)
 
         if retry_result.passed:
+            tool_library.record_signature(sig, tool_name)
             if verbose:
                 print(f"\n>>> SUCCESS: {task.id} PASSED with {cheap_model} + {tool_name}")
                 print(f"    Tool saved: {tool_path}")
@@ -283,11 +518,7 @@ def run_pipeline(
             }
         else:
             if verbose:
-                print(f"  Still failed with tool. Removing and retrying...")
-            retry_info = {
-                "tool_name": tool_name,
-                "verify_message": _generation_feedback(retry_result, allow_verifier_feedback),
-            }
+                print(f"  Still failed with tool. Removing and trying next candidate...")
             tool_library.remove_tool(tool_name)
 
     if verbose:
@@ -302,3 +533,34 @@ def run_pipeline(
         "generation_cost": gen_costs,
         "attempts": max_attempts,
     }
+
+
+def run_pipeline_batch(
+    tasks,
+    cheap_model: str = "gpt-4o-mini",
+    sota_model: str = "gpt-4o",
+    max_attempts: int = 3,
+    verbose: bool = True,
+    allow_verifier_feedback: bool = False,
+):
+    """Run the pipeline over many tasks with the baselines overlapped.
+
+    The initial cheap-model probes are independent and dominated by LLM
+    latency, so they run concurrently on the harness pool; a batch's
+    baseline phase then costs roughly its slowest task instead of the
+    sum. Generation attempts stay sequential because they read and
+    mutate the shared tool library.
+    """
+    initial_results = _harness_for(cheap_model, verbose).run_all(tasks)
+    return [
+        run_pipeline(
+            task=task,
+            cheap_model=cheap_model,
+            sota_model=sota_model,
+            max_attempts=max_attempts,
+            verbose=verbose,
+            allow_verifier_feedback=allow_verifier_feedback,
+            initial_result=result,
+        )
+        for task, result in zip(tasks, initial_results)
+    ]
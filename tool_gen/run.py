@@ -1,14 +1,15 @@
 import argparse
+import os
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "agent_loop"))
 
-from dotenv import load_dotenv
-load_dotenv(Path(__file__).parent.parent / ".env")
+from evals._env import load_env
+load_env(Path(__file__).parent.parent / ".env")
 
-from evals.tasks import ALL_TASKS, TASK_MAP
-from .pipeline import run_pipeline
+from evals.tasks import TASK_IDS, all_tasks, get_task
+from .pipeline import run_pipeline, run_pipeline_batch
 import tool_library
 
 
@@ -23,9 +24,18 @@ def main():
     parser.add_argument("--max-attempts", type=int, default=3, help="Max generation attempts per task (default: 3)")
     parser.add_argument("--allow-verifier-feedback", action="store_true",
                         help="Allow tool generation to see raw hidden verifier output (default: off)")
+    parser.add_argument("--gen-cache", metavar="DIR",
+                        help="Cache SOTA generations on disk, content-addressed by prompt")
+    parser.add_argument("--force-regen", action="store_true",
+                        help="Bypass the generation cache and call the model fresh")
     parser.add_argument("--quiet", action="store_true", help="Suppress verbose output")
     args = parser.parse_args()
 
+    if args.force_regen:
+        os.environ.pop("TOOL_GEN_CACHE", None)
+    elif args.gen_cache:
+        os.environ["TOOL_GEN_CACHE"] = args.gen_cache
+
     if args.list_tools:
         tools = tool_library.list_tools()
         if not tools:
@@ -45,28 +55,36 @@ def main():
         return
 
     if args.task:
-        if args.task not in TASK_MAP:
-            print(f"Unknown task: {args.task!r}. Available: {', '.join(TASK_MAP.keys())}")
+        try:
+            tasks = [get_task(args.task)]
+        except KeyError:
+            print(f"Unknown task: {args.task!r}. Available: {', '.join(TASK_IDS)}")
             sys.exit(1)
-        tasks = [TASK_MAP[args.task]]
     elif args.all:
-        tasks = ALL_TASKS
+        tasks = all_tasks()
     else:
         parser.print_help()
-        print(f"\nAvailable tasks: {', '.join(TASK_MAP.keys())}")
+        print(f"\nAvailable tasks: {', '.join(TASK_IDS)}")
         sys.exit(0)
 
-    results = []
-    for task in tasks:
-        result = run_pipeline(
-            task=task,
+    if len(tasks) > 1:
+        results = run_pipeline_batch(
+            tasks,
             cheap_model=args.cheap_model,
             sota_model=args.sota_model,
             max_attempts=args.max_attempts,
             verbose=not args.quiet,
             allow_verifier_feedback=args.allow_verifier_feedback,
         )
-        results.append(result)
+    else:
+        results = [run_pipeline(
+            task=task,
+            cheap_model=args.cheap_model,
+            sota_model=args.sota_model,
+            max_attempts=args.max_attempts,
+            verbose=not args.quiet,
+            allow_verifier_feedback=args.allow_verifier_feedback,
+        ) for task in tasks]
 
     print(f"\n{'='*60}")
     print(f"Pipeline Summary")
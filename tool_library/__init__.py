@@ -1,34 +1,129 @@
+import atexit
+import hashlib
 import json
+import os
 import shutil
 import importlib.util
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 LIBRARY_DIR = Path(__file__).parent
 GENERATED_DIR = LIBRARY_DIR / "generated"
 REGISTRY_PATH = LIBRARY_DIR / "registry.json"
+SIGNATURES_PATH = LIBRARY_DIR / "signatures.json"
+
+# Bumped on every mutation; lets callers cache load_tools() output and
+# skip re-reading tool modules when the library hasn't changed.
+_version = 0
+
+
+def version() -> int:
+    return _version
+
+
+def _bump_version():
+    global _version
+    _version += 1
+
+
+# The registry lives in memory after first read; mutations mark it
+# dirty and the file is written once at exit (or via flush()) instead
+# of a full parse + serialize round trip per operation.
+_REGISTRY_CACHE = None
+_REGISTRY_DIRTY = False
+
+
+def _loads(data):
+    return _orjson.loads(data) if _orjson else json.loads(data)
 
 
 def _load_registry():
-    if not REGISTRY_PATH.exists():
-        return {"tools": []}
-    return json.loads(REGISTRY_PATH.read_text())
+    global _REGISTRY_CACHE
+    if _REGISTRY_CACHE is None:
+        if REGISTRY_PATH.exists():
+            _REGISTRY_CACHE = _loads(REGISTRY_PATH.read_bytes())
+        else:
+            _REGISTRY_CACHE = {"tools": []}
+    return _REGISTRY_CACHE
 
 
 def _save_registry(registry):
-    REGISTRY_PATH.write_text(json.dumps(registry, indent=2) + "\n")
+    global _REGISTRY_CACHE, _REGISTRY_DIRTY
+    _REGISTRY_CACHE = registry
+    _REGISTRY_DIRTY = True
+    _bump_version()
+
+
+def flush():
+    """Write pending registry mutations to disk."""
+    global _REGISTRY_DIRTY
+    if _REGISTRY_DIRTY:
+        if _orjson:
+            REGISTRY_PATH.write_bytes(
+                _orjson.dumps(_REGISTRY_CACHE, option=_orjson.OPT_INDENT_2) + b"\n")
+        else:
+            REGISTRY_PATH.write_text(json.dumps(_REGISTRY_CACHE, indent=2) + "\n")
+        _REGISTRY_DIRTY = False
+
+
+atexit.register(flush)
+
+
+# Compiled modules cached per file with mtime as validator, so a
+# version bump from registering one tool doesn't re-exec every other
+# unchanged tool when the loaders rebuild.
+_MODULE_CACHE: dict = {}
 
 
 def _load_tool_module(file_path):
+    mtime = os.stat(file_path).st_mtime_ns
+    cached = _MODULE_CACHE.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     spec = importlib.util.spec_from_file_location("tool_module", file_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    _MODULE_CACHE[file_path] = (mtime, module)
     return module
 
 
+# Loader results memoized on _version: each load re-executes every tool
+# module, so repeated calls within one pipeline run (per attempt, per
+# task) would otherwise pay importlib cost for an unchanged library.
+# Callers treat the returned structures as read-only.
+_LOAD_CACHE: dict = {}
+
+
+def _memoized(key, build):
+    cached = _LOAD_CACHE.get(key)
+    if cached is not None and cached[0] == _version:
+        return cached[1]
+    value = build()
+    _LOAD_CACHE[key] = (_version, value)
+    return value
+
+
+def _generated_files():
+    """Names in GENERATED_DIR from one scandir, replacing a stat per entry."""
+    try:
+        return {e.name for e in os.scandir(GENERATED_DIR)}
+    except FileNotFoundError:
+        return set()
+
+
 def load_tools():
     """Load all verified tools. Returns (schemas_list, handlers_dict)."""
+    return _memoized("tools", _load_tools_uncached)
+
+
+def _load_tools_uncached():
     registry = _load_registry()
+    existing = _generated_files()
     schemas = []
     handlers = {}
 
@@ -36,7 +131,7 @@ def load_tools():
         if not entry.get("verified"):
             continue
         tool_path = LIBRARY_DIR / entry["file"]
-        if not tool_path.exists():
+        if tool_path.name not in existing:
             continue
         try:
             module = _load_tool_module(tool_path)
@@ -49,7 +144,21 @@ def load_tools():
     return schemas, handlers
 
 
-def register_tool(name, file_path, task_id, generator_model, verified=False, verified_with=""):
+def code_digest(code: str) -> str:
+    """Content hash of tool source (blake2b: fast, non-cryptographic use)."""
+    return hashlib.blake2b(code.encode(), digest_size=16).hexdigest()
+
+
+def find_by_digest(digest):
+    """Return the name of a registered tool with identical source, if any."""
+    for entry in _load_registry()["tools"]:
+        if entry.get("digest") == digest:
+            return entry["name"]
+    return None
+
+
+def register_tool(name, file_path, task_id, generator_model, verified=False, verified_with="",
+                  digest=None):
     registry = _load_registry()
     registry["tools"] = [t for t in registry["tools"] if t["name"] != name]
     registry["tools"].append({
@@ -59,6 +168,7 @@ def register_tool(name, file_path, task_id, generator_model, verified=False, ver
         "generated_by_model": generator_model,
         "verified": verified,
         "verified_with_model": verified_with,
+        "digest": digest,
         "created_at": datetime.now().isoformat(),
     })
     _save_registry(registry)
@@ -85,13 +195,18 @@ def remove_tool(name):
 
 def load_tool_summaries():
     """Load schemas of all verified tools (lightweight, for prompt injection)."""
+    return _memoized("summaries", _load_tool_summaries_uncached)
+
+
+def _load_tool_summaries_uncached():
     registry = _load_registry()
+    existing = _generated_files()
     schemas = []
     for entry in registry["tools"]:
         if not entry.get("verified"):
             continue
         tool_path = LIBRARY_DIR / entry["file"]
-        if not tool_path.exists():
+        if tool_path.name not in existing:
             continue
         try:
             module = _load_tool_module(tool_path)
@@ -103,13 +218,18 @@ def load_tool_summaries():
 
 def load_tool_usage_examples():
     """Load USAGE_EXAMPLE strings from all verified tools."""
+    return _memoized("examples", _load_tool_usage_examples_uncached)
+
+
+def _load_tool_usage_examples_uncached():
     registry = _load_registry()
+    existing = _generated_files()
     examples = {}
     for entry in registry["tools"]:
         if not entry.get("verified"):
             continue
         tool_path = LIBRARY_DIR / entry["file"]
-        if not tool_path.exists():
+        if tool_path.name not in existing:
             continue
         try:
             module = _load_tool_module(tool_path)
@@ -121,6 +241,32 @@ def load_tool_usage_examples():
     return examples
 
 
+# Failure signatures map a (task prompt, failure) fingerprint to the
+# tool that fixed it, so a recurring failure class skips the SOTA-model
+# generation call entirely.
+def _load_signatures():
+    if not SIGNATURES_PATH.exists():
+        return {}
+    return _loads(SIGNATURES_PATH.read_bytes())
+
+
+def lookup_signature(sig):
+    """Return the tool name recorded for sig, if it is still registered."""
+    name = _load_signatures().get(sig)
+    if name is None:
+        return None
+    for entry in _load_registry()["tools"]:
+        if entry["name"] == name and (LIBRARY_DIR / entry["file"]).exists():
+            return name
+    return None
+
+
+def record_signature(sig, name):
+    signatures = _load_signatures()
+    signatures[sig] = name
+    SIGNATURES_PATH.write_text(json.dumps(signatures, indent=2) + "\n")
+
+
 def list_tools():
     return _load_registry()["tools"]
 